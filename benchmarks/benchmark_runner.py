@@ -3,15 +3,102 @@ Professional benchmark runner with statistical analysis and multiple output form
 """
 
 import time
-import statistics
+import timeit
 import json
 import csv
-from dataclasses import dataclass, asdict
+from array import array
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Any, List, Dict
+from typing import Callable, Any, ContextManager, List, Dict, Optional, Sequence, Tuple, Union
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
+
+
+# Warmup calls for later implementations in a comparison when warmup_first_only is set
+_SHARED_WARMUP = 2
+
+# Buffer size for report files, so exports reach the OS in large chunks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Markdown templates, formatted positionally once per comparison / result
+_COMPARISON_ROW_FMT = "| {} | {:.4f} ± {:.4f} | {:.4f} ± {:.4f} | {:+.2f}x | {:+.2f}% | {} |\n"
+_RESULT_SECTION_FMT = (
+    "### {}\n\n"
+    "**Description:** {}\n\n"
+    "**Iterations:** {}\n\n"
+    "| Metric | Value (ms) |\n"
+    "|--------|------------|\n"
+    "| Mean | {:.4f} |\n"
+    "| Median | {:.4f} |\n"
+    "| Std Dev | {:.4f} |\n"
+    "| Min | {:.4f} |\n"
+    "| Max | {:.4f} |\n"
+    "| P95 | {:.4f} |\n"
+    "| P99 | {:.4f} |\n"
+    "\n**Records Processed:** {}\n\n"
+)
+
+
+def _mean_stdev(timings: Sequence[float]) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation in a single pass (Welford's algorithm).
+
+    Avoids the statistics module, whose exact-fraction arithmetic is far slower
+    for plain floats. A single sample has a standard deviation of 0.0.
+    """
+    mean = 0.0
+    m2 = 0.0
+    for count, value in enumerate(timings, 1):
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    n = len(timings)
+    return mean, (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+
+
+def _timing_stats(timings: Sequence[float]) -> Dict[str, float]:
+    """
+    Mean, median, std_dev, min, max, p95 and p99 of timings in collection order.
+
+    The order statistics come from one sorted copy, so the caller's samples
+    keep their iteration order. A selection algorithm (quickselect) would be
+    O(n) in theory, but written in Python it loses to the C sort at any
+    realistic iteration count.
+    """
+    mean, std_dev = _mean_stdev(timings)
+    sorted_timings = sorted(timings)
+    return {
+        "mean": mean,
+        "median": _percentile(sorted_timings, 0.50),
+        "std_dev": std_dev,
+        "min": sorted_timings[0],
+        "max": sorted_timings[-1],
+        "p95": _percentile(sorted_timings, 0.95),
+        "p99": _percentile(sorted_timings, 0.99),
+    }
+
+
+def _percentile(sorted_timings: Sequence[float], fraction: float) -> float:
+    """
+    Linearly interpolated percentile of pre-sorted samples.
+
+    Matches numpy's default ("linear") method, so p95 of 100 samples is
+    interpolated between the 95th and 96th values instead of picking one index.
+    """
+    position = (len(sorted_timings) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_timings) - 1)
+    weight = position - lower
+    return sorted_timings[lower] + (sorted_timings[upper] - sorted_timings[lower]) * weight
+
 
 @dataclass
 class BenchmarkResult:
@@ -33,10 +120,14 @@ class BenchmarkResult:
     records_processed: int
     timestamp: str
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    @cached_property
+    def _cached_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (computed once per instance)."""
+        return self._cached_dict
+
 
 @dataclass
 class ComparisonResult:
@@ -62,10 +153,14 @@ class ComparisonResult:
     records_processed: int
     timestamp: str
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    @cached_property
+    def _cached_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (computed once per instance)."""
+        return self._cached_dict
+
 
 @dataclass
 class MultiComparisonResult:
@@ -84,10 +179,58 @@ class MultiComparisonResult:
     records_processed: int
     timestamp: str
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    @cached_property
+    def _cached_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (computed once per instance)."""
+        return self._cached_dict
+
+
+@contextmanager
+def _rolled_back_transaction():
+    """Run the block inside a single Django transaction that is rolled back on exit."""
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def _speedups(baseline_mean: float, means: Sequence[float]) -> List[float]:
+    """
+    Relative speedup of each mean against a baseline (positive means faster).
+
+    Computed for all implementations at once; a zero baseline yields 0.0
+    rather than dividing by zero.
+    """
+    if baseline_mean <= 0:
+        return [0.0] * len(means)
+    inverse = 1.0 / baseline_mean
+    return [1.0 - mean * inverse for mean in means]
+
+
+_COMPARISON_FIELDS = tuple(f.name for f in fields(ComparisonResult))
+
+# True for the Django rolled-back transaction, or a factory returning a context
+# manager that rolls back an implementation's own connection
+TransactionWrap = Union[bool, Callable[[], ContextManager]]
+
+
+def _transaction_context(wrap: TransactionWrap) -> ContextManager:
+    """Context manager for a run_single wrap_in_transaction argument."""
+    if callable(wrap):
+        return wrap()
+    return _rolled_back_transaction() if wrap else nullcontext()
+
 
 class BenchmarkRunner:
     """Professional benchmark runner with statistical analysis."""
@@ -98,6 +241,12 @@ class BenchmarkRunner:
         self.results: List[BenchmarkResult] = []
         self.comparisons: List[ComparisonResult] = []
         self.multi_comparisons: List[MultiComparisonResult] = []
+        # Raw per-iteration timings (ms, in collection order), parallel to self.results
+        self.raw_timings: List[array] = []
+        # One clock read per sweep; every result and export shares this timestamp
+        self.sweep_ts = datetime.now()
+        self._sweep_iso = self.sweep_ts.isoformat()
+        self._sweep_stamp = self.sweep_ts.strftime('%Y%m%d_%H%M%S')
 
     def run_single(
         self,
@@ -105,7 +254,9 @@ class BenchmarkRunner:
         description: str,
         func: Callable,
         iterations: int = 100,
-        warmup: int = 10
+        warmup: int = 10,
+        wrap_in_transaction: TransactionWrap = False,
+        cleanup: Optional[Callable] = None
     ) -> BenchmarkResult:
         """
         Run a single benchmark with proper warmup and statistical analysis.
@@ -116,37 +267,97 @@ class BenchmarkRunner:
             func: Function to benchmark (should return result for verification)
             iterations: Number of iterations to run
             warmup: Number of warmup iterations
+            wrap_in_transaction: Run warmup and timed iterations inside one Django
+                transaction that is rolled back afterwards, so write benchmarks
+                measure the query path rather than a commit per iteration. A
+                callable is used instead as the factory for that context manager,
+                for functions that write through a connection other than Django's
+            cleanup: Optional function run after every warmup and timed call,
+                outside the timed region (e.g. deleting rows a write benchmark created)
 
         Returns:
             BenchmarkResult with statistical analysis
         """
-        # Warmup phase
-        for _ in range(warmup):
-            func()
+        # Bind hot-loop lookups to locals so they stay out of the timed region
+        perf_ns = time.perf_counter_ns
+        call = func
 
-        # Benchmark phase
-        timings = []
+        timings_ns = array("q", bytes(8 * iterations))
         result = None
-        for _ in range(iterations):
-            start = time.perf_counter()
-            result = func()
-            end = time.perf_counter()
-            timings.append((end - start) * 1000)  # Convert to milliseconds
-
-        # Calculate statistics
-        timings.sort()
-        mean_time = statistics.mean(timings)
-        median_time = statistics.median(timings)
-        std_dev = statistics.stdev(timings) if len(timings) > 1 else 0
-        min_time = min(timings)
-        max_time = max(timings)
-
-        # Calculate percentiles
-        p95_idx = int(len(timings) * 0.95)
-        p99_idx = int(len(timings) * 0.99)
-        p95 = timings[p95_idx]
-        p99 = timings[p99_idx]
 
+        with _transaction_context(wrap_in_transaction):
+            if warmup:
+                self._warmup(call, warmup, cleanup)
+
+            # Benchmark phase (pre-allocated int64 nanosecond buffer, filled by index)
+            if cleanup is None:
+                for i in range(iterations):
+                    start = perf_ns()
+                    result = call()
+                    timings_ns[i] = perf_ns() - start
+            else:
+                for i in range(iterations):
+                    start = perf_ns()
+                    result = call()
+                    timings_ns[i] = perf_ns() - start
+                    cleanup()
+
+        # Convert to milliseconds once, after the timed loop
+        timings = array("d", (t * 1e-6 for t in timings_ns))
+        return self._record(name, description, iterations, timings, result)
+
+    @staticmethod
+    def _warmup(func: Callable, count: int, cleanup: Optional[Callable] = None) -> None:
+        """Call func count times, untimed, to populate caches before measuring."""
+        for _ in range(count):
+            func()
+            if cleanup is not None:
+                cleanup()
+
+    def run_micro(
+        self,
+        name: str,
+        description: str,
+        func: Callable,
+        iterations: int = 100,
+        number: int = 0
+    ) -> BenchmarkResult:
+        """
+        Benchmark a fast, in-memory callable (e.g. building SQL without executing it).
+
+        For sub-microsecond functions the per-sample timer calls in run_single
+        dominate the measurement. This uses timeit's compiled inner loop instead:
+        each of the ``iterations`` samples times ``number`` back-to-back calls and
+        records the per-call average.
+
+        Args:
+            name: Benchmark name
+            description: Benchmark description
+            func: Function to benchmark
+            iterations: Number of samples to collect
+            number: Calls per sample (0 sizes it automatically with timeit.autorange)
+
+        Returns:
+            BenchmarkResult with per-call timings in milliseconds
+        """
+        timer = timeit.Timer(func)
+        if number <= 0:
+            # autorange also serves as the warmup phase
+            number, _ = timer.autorange()
+
+        scale = 1000 / number
+        timings = array("d", (total * scale for total in timer.repeat(repeat=iterations, number=number)))
+        return self._record(name, description, iterations, timings, func())
+
+    def _record(
+        self,
+        name: str,
+        description: str,
+        iterations: int,
+        timings: array,
+        result: Any
+    ) -> BenchmarkResult:
+        """Summarize millisecond timings into a BenchmarkResult and store both."""
         # Determine records processed
         records_processed = 0
         if result is not None:
@@ -159,20 +370,31 @@ class BenchmarkRunner:
             name=name,
             description=description,
             iterations=iterations,
-            mean=mean_time,
-            median=median_time,
-            std_dev=std_dev,
-            min=min_time,
-            max=max_time,
-            p95=p95,
-            p99=p99,
+            **_timing_stats(timings),
             records_processed=records_processed,
-            timestamp=datetime.now().isoformat()
+            timestamp=self._sweep_iso
         )
 
         self.results.append(benchmark_result)
+        self.raw_timings.append(timings)
         return benchmark_result
 
+    def compute_summary(self) -> Dict[str, List[Any]]:
+        """
+        Recompute statistics for every benchmark from the raw timings.
+
+        Returns a column-oriented table (one list per metric, indexed like
+        self.results) that is convenient for plotting and post-hoc analysis.
+        """
+        summary: Dict[str, List[Any]] = {
+            "name": [r.name for r in self.results],
+            "iterations": [len(t) for t in self.raw_timings],
+        }
+        for stats in map(_timing_stats, self.raw_timings):
+            for metric, value in stats.items():
+                summary.setdefault(metric, []).append(value)
+        return summary
+
     def run_comparison(
         self,
         name: str,
@@ -180,7 +402,10 @@ class BenchmarkRunner:
         django_func: Callable,
         djazzle_func: Callable,
         iterations: int = 100,
-        warmup: int = 10
+        warmup: int = 10,
+        wrap_in_transaction: TransactionWrap = False,
+        warmup_first_only: bool = False,
+        cleanup: Optional[Callable] = None
     ) -> ComparisonResult:
         """
         Run a comparison benchmark between Django ORM and Djazzle.
@@ -192,6 +417,13 @@ class BenchmarkRunner:
             djazzle_func: Djazzle query function
             iterations: Number of iterations
             warmup: Number of warmup iterations
+            wrap_in_transaction: Run warmup and timed iterations inside one Django
+                transaction that is rolled back afterwards (see run_single)
+            warmup_first_only: Give only the first implementation the full warmup;
+                later ones share its warm database caches and run at most
+                _SHARED_WARMUP warmup calls for their own code paths
+            cleanup: Optional untimed function run after every call of either
+                implementation (see run_single)
 
         Returns:
             ComparisonResult with comparative statistics
@@ -202,7 +434,9 @@ class BenchmarkRunner:
             description,
             django_func,
             iterations,
-            warmup
+            warmup,
+            wrap_in_transaction,
+            cleanup
         )
 
         djazzle_result = self.run_single(
@@ -210,11 +444,13 @@ class BenchmarkRunner:
             description,
             djazzle_func,
             iterations,
-            warmup
+            min(_SHARED_WARMUP, warmup) if warmup_first_only else warmup,
+            wrap_in_transaction,
+            cleanup
         )
 
         # Calculate comparison metrics
-        speedup = (django_result.mean - djazzle_result.mean) / django_result.mean
+        speedup = _speedups(django_result.mean, (djazzle_result.mean,))[0]
         percent_diff = speedup * 100
 
         comparison = ComparisonResult(
@@ -230,7 +466,7 @@ class BenchmarkRunner:
             speedup=speedup,
             percent_difference=percent_diff,
             records_processed=django_result.records_processed,
-            timestamp=datetime.now().isoformat()
+            timestamp=self._sweep_iso
         )
 
         self.comparisons.append(comparison)
@@ -242,7 +478,10 @@ class BenchmarkRunner:
         description: str,
         implementations: Dict[str, Callable],
         iterations: int = 100,
-        warmup: int = 10
+        warmup: int = 10,
+        wrap_in_transaction: Union[TransactionWrap, Dict[str, TransactionWrap]] = False,
+        warmup_first_only: bool = False,
+        cleanup: Union[Callable, Dict[str, Callable], None] = None
     ) -> MultiComparisonResult:
         """
         Run a multi-way comparison benchmark across multiple implementations.
@@ -255,20 +494,36 @@ class BenchmarkRunner:
                                   "psycopg2": psycopg2_func, "psycopg3": psycopg3_func}
             iterations: Number of iterations
             warmup: Number of warmup iterations
+            wrap_in_transaction: Run warmup and timed iterations inside a rolled-back
+                transaction (see run_single), or a dict mapping implementation name
+                to its own setting, for implementations that write through a
+                different connection
+            warmup_first_only: Give only the first implementation the full warmup;
+                later ones share its warm database caches and run at most
+                _SHARED_WARMUP warmup calls for their own code paths
+            cleanup: Optional untimed function run after every call (see run_single),
+                or a dict mapping implementation name to its own cleanup, for
+                implementations that write through a different connection
 
         Returns:
             MultiComparisonResult with comparative statistics
         """
         # Run benchmarks for all implementations
         impl_results = {}
+        impl_warmup = warmup
         for impl_name, impl_func in implementations.items():
             result = self.run_single(
                 f"{name} ({impl_name})",
                 description,
                 impl_func,
                 iterations,
-                warmup
+                impl_warmup,
+                (wrap_in_transaction.get(impl_name, False)
+                 if isinstance(wrap_in_transaction, dict) else wrap_in_transaction),
+                cleanup.get(impl_name) if isinstance(cleanup, dict) else cleanup
             )
+            if warmup_first_only:
+                impl_warmup = min(_SHARED_WARMUP, warmup)
             impl_results[impl_name] = {
                 "mean": result.mean,
                 "median": result.median,
@@ -279,23 +534,18 @@ class BenchmarkRunner:
                 "p99": result.p99,
             }
 
-        # Calculate comparison metrics relative to Django ORM baseline
+        # Calculate comparison metrics relative to Django ORM baseline in one pass
         django_mean = impl_results.get("Django ORM", {}).get("mean", 0)
+        impl_names = list(impl_results)
+        deltas = _speedups(django_mean, [impl_results[n]["mean"] for n in impl_names])
         speedups = {}
         percent_differences = {}
 
-        for impl_name, metrics in impl_results.items():
+        for impl_name, speedup in zip(impl_names, deltas):
             if impl_name == "Django ORM":
-                speedups[impl_name] = 0.0
-                percent_differences[impl_name] = 0.0
-            else:
-                if django_mean > 0:
-                    speedup = (django_mean - metrics["mean"]) / django_mean
-                    speedups[impl_name] = speedup
-                    percent_differences[impl_name] = speedup * 100
-                else:
-                    speedups[impl_name] = 0.0
-                    percent_differences[impl_name] = 0.0
+                speedup = 0.0
+            speedups[impl_name] = speedup
+            percent_differences[impl_name] = speedup * 100
 
         # Get records processed from first implementation
         first_impl = list(implementations.keys())[0]
@@ -309,48 +559,67 @@ class BenchmarkRunner:
             speedups=speedups,
             percent_differences=percent_differences,
             records_processed=records_processed,
-            timestamp=datetime.now().isoformat()
+            timestamp=self._sweep_iso
         )
 
         self.multi_comparisons.append(multi_comparison)
         return multi_comparison
 
-    def export_json(self, filename: str = None) -> Path:
-        """Export results to JSON format."""
-        if filename is None:
-            filename = f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    def _default_name(self, ext: str) -> str:
+        """Default export filename; every format from one sweep shares the same stem."""
+        return f"benchmark_{self._sweep_stamp}.{ext}"
+
+    def export_json(self, filename: str = None, pretty: bool = False) -> Path:
+        """
+        Export results to JSON format.
+
+        Records are serialized and streamed one at a time through a buffered
+        file, so no combined document is built in memory. Pass ``pretty=True``
+        to indent each record. Uses orjson when it is installed.
+        """
+        filename = filename or self._default_name("json")
 
         output_path = self.output_dir / filename
 
-        data = {
-            "metadata": {
-                "timestamp": datetime.now().isoformat(),
-                "python_version": sys.version,
-            },
-            "results": [r.to_dict() for r in self.results],
-            "comparisons": [c.to_dict() for c in self.comparisons],
-            "multi_comparisons": [mc.to_dict() for mc in self.multi_comparisons]
+        metadata = {
+            "timestamp": self._sweep_iso,
+            "python_version": sys.version,
         }
+        sections = (
+            ("results", self.results),
+            ("comparisons", self.comparisons),
+            ("multi_comparisons", self.multi_comparisons),
+        )
 
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            write(b'{"metadata": ')
+            write(_json_dumps(metadata, pretty))
+            for key, records in sections:
+                write(f', "{key}": ['.encode())
+                for i, record in enumerate(records):
+                    if i:
+                        write(b", ")
+                    write(_json_dumps(record.to_dict(), pretty))
+                write(b"]")
+            write(b"}\n")
 
         return output_path
 
     def export_csv(self, filename: str = None) -> Path:
         """Export comparison results to CSV format."""
-        if filename is None:
-            filename = f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = filename or self._default_name("csv")
 
         output_path = self.output_dir / filename
 
-        with open(output_path, 'w', newline='') as f:
-            # Export regular comparisons
+        with open(output_path, 'w', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+
+            # Export regular comparisons as plain tuples in field order
             if self.comparisons:
-                writer = csv.DictWriter(f, fieldnames=self.comparisons[0].to_dict().keys())
-                writer.writeheader()
-                for comparison in self.comparisons:
-                    writer.writerow(comparison.to_dict())
+                writer.writerow(_COMPARISON_FIELDS)
+                row_values = attrgetter(*_COMPARISON_FIELDS)
+                writer.writerows(row_values(c) for c in self.comparisons)
 
             # Export multi-comparisons with flattened structure
             if self.multi_comparisons:
@@ -385,104 +654,102 @@ class BenchmarkRunner:
                     if self.comparisons:
                         f.write("\n")
 
-                    writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                    writer.writeheader()
-                    writer.writerows(rows)
+                    writer.writerow(rows[0].keys())
+                    writer.writerows(row.values() for row in rows)
 
         return output_path
 
     def export_markdown(self, filename: str = None) -> Path:
         """Export results to Markdown format."""
-        if filename is None:
-            filename = f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        filename = filename or self._default_name("md")
 
         output_path = self.output_dir / filename
 
-        with open(output_path, 'w') as f:
-            f.write("# Djazzle Performance Benchmarks\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"**Python Version:** {sys.version}\n\n")
-
-            # Export regular comparisons
-            if self.comparisons:
-                f.write("## Comparison Results (Django vs Djazzle)\n\n")
-                f.write("| Benchmark | Django ORM (ms) | Djazzle (ms) | Speedup | % Difference | Records |\n")
-                f.write("|-----------|-----------------|--------------|---------|--------------|----------|\n")
-
-                for comp in self.comparisons:
-                    speedup_str = f"{comp.speedup:+.2f}x"
-                    percent_str = f"{comp.percent_difference:+.2f}%"
+        # Build the whole document in memory and hand it to the file in one write
+        parts: List[str] = []
+        append = parts.append
 
-                    f.write(f"| {comp.name} | "
-                           f"{comp.django_mean:.4f} ± {comp.django_std_dev:.4f} | "
-                           f"{comp.djazzle_mean:.4f} ± {comp.djazzle_std_dev:.4f} | "
-                           f"{speedup_str} | "
-                           f"{percent_str} | "
-                           f"{comp.records_processed} |\n")
+        append("# Djazzle Performance Benchmarks\n\n")
+        append(f"**Generated:** {self.sweep_ts.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        append(f"**Python Version:** {sys.version}\n\n")
 
-                f.write("\n")
+        # Export regular comparisons
+        if self.comparisons:
+            append(
+                "## Comparison Results (Django vs Djazzle)\n\n"
+                "| Benchmark | Django ORM (ms) | Djazzle (ms) | Speedup | % Difference | Records |\n"
+                "|-----------|-----------------|--------------|---------|--------------|----------|\n"
+            )
 
-            # Export multi-comparisons
-            if self.multi_comparisons:
-                f.write("## Multi-Implementation Comparison Results\n\n")
-                f.write("*All speedup/difference metrics are relative to Django ORM baseline*\n\n")
+            row_fmt = _COMPARISON_ROW_FMT.format
+            for comp in self.comparisons:
+                append(row_fmt(
+                    comp.name,
+                    comp.django_mean, comp.django_std_dev,
+                    comp.djazzle_mean, comp.djazzle_std_dev,
+                    comp.speedup, comp.percent_difference,
+                    comp.records_processed,
+                ))
 
-                for mc in self.multi_comparisons:
-                    f.write(f"### {mc.name}\n\n")
-                    f.write(f"**Description:** {mc.description}\n\n")
-                    f.write(f"**Records:** {mc.records_processed} | **Iterations:** {mc.iterations}\n\n")
-
-                    # Create header row based on available implementations
-                    impl_names = list(mc.implementations.keys())
-                    header = "| Implementation |"
-                    separator = "|----------------|"
-                    for impl_name in impl_names:
-                        header += f" {impl_name} (ms) |"
-                        separator += "---------|"
-
-                    # Add speedup columns for non-Django implementations
-                    for impl_name in impl_names:
-                        if impl_name != "Django ORM":
-                            header += f" {impl_name} vs Django |"
-                            separator += "------------------|"
+            append("\n")
 
-                    f.write(header + "\n")
-                    f.write(separator + "\n")
+        # Export multi-comparisons
+        if self.multi_comparisons:
+            append(
+                "## Multi-Implementation Comparison Results\n\n"
+                "*All speedup/difference metrics are relative to Django ORM baseline*\n\n"
+            )
 
-                    # Write data row
-                    row = "| Mean |"
-                    for impl_name in impl_names:
-                        metrics = mc.implementations[impl_name]
-                        row += f" {metrics['mean']:.4f} ± {metrics['std_dev']:.4f} |"
+            for mc in self.multi_comparisons:
+                append(
+                    f"### {mc.name}\n\n"
+                    f"**Description:** {mc.description}\n\n"
+                    f"**Records:** {mc.records_processed} | **Iterations:** {mc.iterations}\n\n"
+                )
+
+                # Create header row based on available implementations
+                impl_names = list(mc.implementations.keys())
+                header = ["| Implementation |"]
+                separator = ["|----------------|"]
+                for impl_name in impl_names:
+                    header.append(f" {impl_name} (ms) |")
+                    separator.append("---------|")
+
+                # Add speedup columns for non-Django implementations
+                for impl_name in impl_names:
+                    if impl_name != "Django ORM":
+                        header.append(f" {impl_name} vs Django |")
+                        separator.append("------------------|")
+
+                # Data row
+                row = ["| Mean |"]
+                for impl_name in impl_names:
+                    metrics = mc.implementations[impl_name]
+                    row.append(f" {metrics['mean']:.4f} ± {metrics['std_dev']:.4f} |")
+
+                # Add speedup columns
+                for impl_name in impl_names:
+                    if impl_name != "Django ORM":
+                        speedup = mc.speedups[impl_name]
+                        percent_diff = mc.percent_differences[impl_name]
+                        verdict = "FASTER" if speedup > 0 else "SLOWER"
+                        row.append(f" {percent_diff:+.2f}% {verdict} |")
+
+                append(f"{''.join(header)}\n{''.join(separator)}\n{''.join(row)}\n\n")
+
+        if self.results:
+            append("## Detailed Results\n\n")
+            result_fmt = _RESULT_SECTION_FMT.format
+            for result in self.results:
+                append(result_fmt(
+                    result.name, result.description, result.iterations,
+                    result.mean, result.median, result.std_dev,
+                    result.min, result.max, result.p95, result.p99,
+                    result.records_processed,
+                ))
 
-                    # Add speedup columns
-                    for impl_name in impl_names:
-                        if impl_name != "Django ORM":
-                            speedup = mc.speedups[impl_name]
-                            percent_diff = mc.percent_differences[impl_name]
-                            if speedup > 0:
-                                row += f" {percent_diff:+.2f}% FASTER |"
-                            else:
-                                row += f" {percent_diff:+.2f}% SLOWER |"
-
-                    f.write(row + "\n\n")
-
-            if self.results:
-                f.write("## Detailed Results\n\n")
-                for result in self.results:
-                    f.write(f"### {result.name}\n\n")
-                    f.write(f"**Description:** {result.description}\n\n")
-                    f.write(f"**Iterations:** {result.iterations}\n\n")
-                    f.write("| Metric | Value (ms) |\n")
-                    f.write("|--------|------------|\n")
-                    f.write(f"| Mean | {result.mean:.4f} |\n")
-                    f.write(f"| Median | {result.median:.4f} |\n")
-                    f.write(f"| Std Dev | {result.std_dev:.4f} |\n")
-                    f.write(f"| Min | {result.min:.4f} |\n")
-                    f.write(f"| Max | {result.max:.4f} |\n")
-                    f.write(f"| P95 | {result.p95:.4f} |\n")
-                    f.write(f"| P99 | {result.p99:.4f} |\n")
-                    f.write(f"\n**Records Processed:** {result.records_processed}\n\n")
+        with open(output_path, 'w') as f:
+            f.write("".join(parts))
 
         return output_path
 
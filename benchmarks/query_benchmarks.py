@@ -6,51 +6,60 @@ Use run_benchmarks.py in the project root for standalone execution.
 """
 
 import os
+from contextlib import contextmanager
+from functools import partial
 from tests.models import User
-from src.djazzle import TableFromModel, DjazzleQuery, eq, desc, like
+from src.djazzle import TableFromModel, DjazzleQuery, eq, gt, desc, like, in_array
 from .benchmark_runner import BenchmarkRunner
 import django
 from django.conf import settings
-from typing import Optional
+from django.db import transaction
+from typing import Optional, Set
 
 
 # Global connection objects for psycopg2 and psycopg3
 _psycopg2_conn = None
 _psycopg3_conn = None
+_psycopg3_pool = None
+# Connection parameters of Django's (test) database, shared by the getters below
+_pg_connect_kwargs = None
 
 
 def is_postgres_configured():
     """Check if PostgreSQL is configured as the database backend."""
-    from django.conf import settings
     engine = settings.DATABASES['default']['ENGINE']
     return 'postgresql' in engine or 'psycopg' in engine
 
 
-def get_psycopg2_connection():
-    """Get or create a psycopg2 connection using Django settings."""
-    global _psycopg2_conn
-    if _psycopg2_conn is None:
+def _psycopg_connect_kwargs() -> dict:
+    """Return (and cache) connection kwargs for the database Django is using."""
+    global _pg_connect_kwargs
+    if _pg_connect_kwargs is None:
         if not is_postgres_configured():
             raise RuntimeError("PostgreSQL is not configured. Use --use-postgres flag.")
 
-        import psycopg2
         from django.db import connection
-        from django.conf import settings
 
         # Use Django's connection to get the actual test database name
-        # Use connection.ensure_connection() to make sure connection is established
         connection.ensure_connection()
-
-        # Get settings from Django's connection (which points to the test database)
         db_settings = connection.settings_dict
+        _pg_connect_kwargs = {
+            "dbname": db_settings['NAME'],
+            "user": db_settings['USER'],
+            "password": db_settings['PASSWORD'],
+            "host": db_settings['HOST'],
+            "port": db_settings['PORT'],
+        }
+    return _pg_connect_kwargs
 
-        _psycopg2_conn = psycopg2.connect(
-            dbname=db_settings['NAME'],
-            user=db_settings['USER'],
-            password=db_settings['PASSWORD'],
-            host=db_settings['HOST'],
-            port=db_settings['PORT']
-        )
+
+def get_psycopg2_connection():
+    """Get or create a psycopg2 connection using Django settings."""
+    global _psycopg2_conn
+    if _psycopg2_conn is None:
+        import psycopg2
+
+        _psycopg2_conn = psycopg2.connect(**_psycopg_connect_kwargs())
         _psycopg2_conn.autocommit = True
     return _psycopg2_conn
 
@@ -59,638 +68,955 @@ def get_psycopg3_connection():
     """Get or create a psycopg3 connection using Django settings."""
     global _psycopg3_conn
     if _psycopg3_conn is None:
-        if not is_postgres_configured():
-            raise RuntimeError("PostgreSQL is not configured. Use --use-postgres flag.")
-
         import psycopg
-        from django.db import connection
-        from django.conf import settings
-
-        # Use Django's connection to get the actual test database name
-        # Use connection.ensure_connection() to make sure connection is established
-        connection.ensure_connection()
-
-        # Get settings from Django's connection (which points to the test database)
-        db_settings = connection.settings_dict
 
         _psycopg3_conn = psycopg.connect(
-            dbname=db_settings['NAME'],
-            user=db_settings['USER'],
-            password=db_settings['PASSWORD'],
-            host=db_settings['HOST'],
-            port=db_settings['PORT'],
-            autocommit=True
+            **_psycopg_connect_kwargs(),
+            autocommit=True,
+            # Server-side prepare every statement from its first execution, so
+            # the warmup calls leave the timed iterations running prepared plans
+            prepare_threshold=1
         )
     return _psycopg3_conn
 
 
+def get_psycopg3_pool(min_size: int = 4, max_size: int = 8):
+    """Get or create a psycopg3 connection pool (psycopg_pool) using Django settings."""
+    global _psycopg3_pool
+    if _psycopg3_pool is None:
+        from psycopg_pool import ConnectionPool
+
+        _psycopg3_pool = ConnectionPool(
+            kwargs={**_psycopg_connect_kwargs(), "autocommit": True, "prepare_threshold": 1},
+            min_size=min_size,
+            max_size=max_size,
+            open=True,
+        )
+        _psycopg3_pool.wait()
+    return _psycopg3_pool
+
+
+@contextmanager
+def _psycopg2_rolled_back():
+    """Run the block in one transaction on the shared psycopg2 connection, rolled back on exit."""
+    conn = get_psycopg2_connection()
+    conn.autocommit = False
+    try:
+        yield
+    finally:
+        conn.rollback()
+        conn.autocommit = True
+
+
+def _psycopg3_rolled_back():
+    """Run the block in one transaction on the shared psycopg3 connection, rolled back on exit."""
+    return get_psycopg3_connection().transaction(force_rollback=True)
+
+
+# wrap_in_transaction for the write benchmarks: the raw-driver variants commit on
+# their own autocommit connections, so Django's transaction would not cover them
+_ROLLED_BACK_WRITES = {
+    "Django ORM": True,
+    "Djazzle": True,
+    "Djazzle+psycopg2": _psycopg2_rolled_back,
+    "Djazzle+psycopg3": _psycopg3_rolled_back,
+}
+
+
 def close_psycopg_connections():
     """Close psycopg connections."""
-    global _psycopg2_conn, _psycopg3_conn
+    global _psycopg2_conn, _psycopg3_conn, _psycopg3_pool, _pg_connect_kwargs
     if _psycopg2_conn:
         _psycopg2_conn.close()
         _psycopg2_conn = None
     if _psycopg3_conn:
         _psycopg3_conn.close()
         _psycopg3_conn = None
+    if _psycopg3_pool:
+        _psycopg3_pool.close()
+        _psycopg3_pool = None
+    _pg_connect_kwargs = None
 
 
-def setup_test_data(num_records: int = 10000):
-    """Create test data for benchmarks."""
-    print(f"Setting up test data: {num_records} records...")
+# Column order for generated test rows (matches _test_user_rows tuples)
+_TEST_USER_FIELDS = ("name", "age", "email", "username", "address")
+
+# PostgreSQL types of _TEST_USER_FIELDS, for binary COPY (which does not infer them)
+_TEST_USER_COPY_TYPES = ("varchar", "int4", "varchar", "varchar", "varchar")
 
-    # Clear existing data
-    User.objects.all().delete()
 
-    # Bulk create users
-    users_to_create = []
+def _test_user_rows(num_records: int):
+    """Yield (name, age, email, username, address) tuples for the test users."""
     for i in range(num_records):
-        users_to_create.append(
-            User(
-                name=f"User{i}",
-                age=(20 + (i % 60)) if i % 10 != 0 else None,
-                email=f"user{i}@email.com",
-                username=f"user{i}",
-                address=f"user{i}",
-            )
+        yield (
+            f"User{i}",
+            (20 + (i % 60)) if i % 10 != 0 else None,
+            f"user{i}@email.com",
+            f"user{i}",
+            f"user{i}",
         )
 
-    User.objects.bulk_create(users_to_create, batch_size=1000)
-    print(f"Created {User.objects.count()} test records\n")
 
+def _copy_test_data(num_records: int):
+    """
+    Load test users with PostgreSQL COPY FROM STDIN.
 
-def run_all_benchmarks(
-    num_records: int = 10000,
-    iterations: int = 100,
-    output_dir: str = "benchmark_results",
-    use_postgres: bool = False
-) -> BenchmarkRunner:
+    COPY skips per-row statement parsing/planning and ORM instance construction,
+    which makes large fixtures load in a fraction of the bulk_create time.
     """
-    Run all benchmarks comparing Djazzle and Django ORM.
+    from django.db import connection
+
+    table = connection.ops.quote_name(User._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(f) for f in _TEST_USER_FIELDS)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"TRUNCATE {table} RESTART IDENTITY CASCADE")
+        raw_cursor = cursor.cursor
+
+        if hasattr(raw_cursor, "copy"):
+            # psycopg3: stream rows straight into the binary COPY protocol
+            with raw_cursor.copy(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT BINARY)") as copy:
+                copy.set_types(_TEST_USER_COPY_TYPES)
+                for row in _test_user_rows(num_records):
+                    copy.write_row(row)
+        else:
+            # psycopg2: feed CSV, where an unquoted empty field is NULL
+            import csv
+            import io
+
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(_test_user_rows(num_records))
+            buffer.seek(0)
+            raw_cursor.copy_expert(
+                f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
 
-    Args:
-        num_records: Number of records to create for testing
-        iterations: Number of iterations per benchmark
-        output_dir: Directory to save results
-        use_postgres: Whether to include psycopg2/psycopg3 benchmarks (requires PostgreSQL)
 
-    Returns:
-        BenchmarkRunner with all results
+def bulk_insert_with_copy(conn, table: str, columns, rows, types=None):
     """
-    # Setup
-    num_tests = 10
-    setup_test_data(num_records)
-    runner = BenchmarkRunner(output_dir=output_dir)
+    Bulk insert rows through a psycopg3 connection using binary COPY FROM STDIN.
 
-    print("Running benchmarks...\n")
+    Args:
+        conn: psycopg3 connection
+        table: Database table name
+        columns: Column names, in the same order as each row tuple
+        rows: Iterable of row tuples
+        types: PostgreSQL type names for the columns (required by FORMAT BINARY)
+    """
+    column_list = ", ".join(f'"{col}"' for col in columns)
+    with conn.cursor() as cur:
+        with cur.copy(f'COPY "{table}" ({column_list}) FROM STDIN WITH (FORMAT BINARY)') as copy:
+            if types:
+                copy.set_types(types)
+            for row in rows:
+                copy.write_row(row)
+
+
+def bulk_insert_with_execute_values(conn, table: str, columns, rows, page_size: int = 100):
+    """Bulk insert rows through a psycopg2 connection using execute_values()."""
+    from psycopg2.extras import execute_values
+
+    column_list = ", ".join(f'"{col}"' for col in columns)
+    with conn.cursor() as cur:
+        execute_values(
+            cur, f'INSERT INTO "{table}" ({column_list}) VALUES %s', rows, page_size=page_size
+        )
 
-    # Benchmark 1: Select All Records
-    print(f"1/{num_tests} Select all records...")
 
-    def django_select_all():
-        return list(User.objects.all())
+# Benchmark bodies. They live at module level and are bound to their arguments
+# with functools.partial, so the timed calls go through no closure cells.
 
-    users_table = TableFromModel(User)
+def _fetch_queryset(queryset):
+    """Evaluate a fresh clone of a queryset (bypassing its result cache)."""
+    return list(queryset.all())
 
-    def djazzle_select_all():
-        return DjazzleQuery().select().from_(users_table)()
 
-    # Check if we should run psycopg benchmarks (only if postgres is configured)
-    run_psycopg_benchmarks = use_postgres and is_postgres_configured()
+def _iterate_queryset(queryset, chunk_size: int):
+    """Stream a queryset through iterator() instead of its result cache."""
+    return list(queryset.iterator(chunk_size=chunk_size))
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_select_all():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table)()
 
-        def djazzle_psycopg3_select_all():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table)()
+def _iterate_djazzle(query: DjazzleQuery, chunk_size: int):
+    """Stream a Djazzle query through iterator() (fetchmany batches) instead of fetchall()."""
+    return list(query.iterator(chunk_size=chunk_size))
 
-        runner.run_multi_comparison(
-            name="Select All Records",
-            description=f"Fetch all {num_records} records from database",
-            implementations={
-                "Django ORM": django_select_all,
-                "Djazzle": djazzle_select_all,
-                "Djazzle+psycopg2": djazzle_psycopg2_select_all,
-                "Djazzle+psycopg3": djazzle_psycopg3_select_all,
-            },
-            iterations=iterations // 2,
-            warmup=5
-        )
-    else:
-        runner.run_comparison(
-            name="Select All Records",
-            description=f"Fetch all {num_records} records from database",
-            django_func=django_select_all,
-            djazzle_func=djazzle_select_all,
-            iterations=iterations // 2,
-            warmup=5
-        )
 
-    # Benchmark 2: Filtered Query (Single Match)
-    print(f"2/{num_tests} Filtered query (single match)...")
+def _psycopg3_fetch(conn, sql: str, binary: bool = False):
+    """Fetch all rows of sql on a psycopg3 connection, in text or binary format."""
+    with conn.cursor(binary=binary) as cur:
+        cur.execute(sql)
+        return cur.fetchall()
 
-    def django_filtered_single():
-        return list(User.objects.filter(name="User10"))
 
-    def djazzle_filtered_single():
-        return DjazzleQuery().select().from_(users_table).where(
-            eq(users_table.name, "User10")
-        )()
+def _psycopg3_fetch_columns(conn, sql: str, binary: bool = True):
+    """Like _psycopg3_fetch, but transposed once into a dict of column lists."""
+    with conn.cursor(binary=binary) as cur:
+        cur.execute(sql)
+        names = [column.name for column in cur.description]
+        return dict(zip(names, map(list, zip(*cur.fetchall()))))
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_filtered_single():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).where(
-                eq(users_table.name, "User10")
-            )()
-
-        def djazzle_psycopg3_filtered_single():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).where(
-                eq(users_table.name, "User10")
-            )()
 
-        runner.run_multi_comparison(
-            name="Filtered Query (Single Match)",
-            description="WHERE clause returning 1 record",
-            implementations={
-                "Django ORM": django_filtered_single,
-                "Djazzle": djazzle_filtered_single,
-                "Djazzle+psycopg2": djazzle_psycopg2_filtered_single,
-                "Djazzle+psycopg3": djazzle_psycopg3_filtered_single,
-            },
-            iterations=iterations,
-            warmup=10
-        )
-    else:
-        runner.run_comparison(
-            name="Filtered Query (Single Match)",
-            description="WHERE clause returning 1 record",
-            django_func=django_filtered_single,
-            djazzle_func=djazzle_filtered_single,
-            iterations=iterations,
-            warmup=10
-        )
+def _run_concurrently(executor, func, count: int):
+    """Run func count times on the executor and wait for every result."""
+    return [future.result() for future in [executor.submit(func) for _ in range(count)]]
 
-    # Benchmark 3: Select Specific Columns
-    print(f"3/{num_tests} Select specific columns...")
 
-    def django_select_columns():
-        return list(User.objects.values("id", "name", "email"))
+def _run_serially(func, count: int):
+    return [func() for _ in range(count)]
 
-    def djazzle_select_columns():
-        return DjazzleQuery().select("id", "name", "email").from_(users_table)()
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_select_columns():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).select("id", "name", "email").from_(users_table)()
+def _django_create(values: dict):
+    return [User.objects.create(**values)]
 
-        def djazzle_psycopg3_select_columns():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).select("id", "name", "email").from_(users_table)()
 
-        runner.run_multi_comparison(
-            name="Select Specific Columns",
-            description=f"Select 3 columns from {num_records} records",
-            implementations={
-                "Django ORM": django_select_columns,
-                "Djazzle": djazzle_select_columns,
-                "Djazzle+psycopg2": djazzle_psycopg2_select_columns,
-                "Djazzle+psycopg3": djazzle_psycopg3_select_columns,
-            },
-            iterations=iterations // 2,
-            warmup=5
-        )
-    else:
-        runner.run_comparison(
-            name="Select Specific Columns",
-            description=f"Select 2 columns from {num_records} records",
-            django_func=django_select_columns,
-            djazzle_func=djazzle_select_columns,
-            iterations=iterations // 2,
-            warmup=5
-        )
+def _django_bulk_create(instances: list):
+    return User.objects.bulk_create(instances)
 
-    # Benchmark 4: Return Model Instances
-    print(f"4/{num_tests} Return 50 rows as model instances...")
 
-    def django_as_models():
-        return list(User.objects.all()[:50])
+def _django_update(filters: dict, values: dict):
+    User.objects.filter(**filters).update(**values)
+    return None
 
-    def djazzle_as_models():
-        return DjazzleQuery().select().from_(users_table).as_model().limit(50)()
 
-    runner.run_comparison(
-        name="Return 50 Model Instances",
-        description="Query returning 50 rows as Django model instances",
-        django_func=django_as_models,
-        djazzle_func=djazzle_as_models,
-        iterations=iterations,
-        warmup=10
-    )
+# The Djazzle write queries are built (and their SQL compiled) once at setup;
+# each timed call only executes the prebuilt query.
 
-    # Benchmark 5: First N Records
-    print(f"5/{num_tests} First N records...")
+def _djazzle_insert(table, values, conn=None) -> DjazzleQuery:
+    return DjazzleQuery(conn=conn).insert(table).values(values)
 
-    def django_limit():
-        return list(User.objects.all()[:100])
 
-    def djazzle_first_100():
-        results = DjazzleQuery().select().from_(users_table).limit(100)()
-        return results
+def _djazzle_update(table, values: dict, condition, conn=None) -> DjazzleQuery:
+    return DjazzleQuery(conn=conn).update(table).set(values).where(condition)
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_first_100():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).limit(100)()
 
-        def djazzle_psycopg3_first_100():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).limit(100)()
+def setup_test_data(num_records: int = 10000):
+    """Create test data for benchmarks."""
+    print(f"Setting up test data: {num_records} records...")
 
-        runner.run_multi_comparison(
-            name="First 100 Records",
-            description="Fetch only first 100 records",
-            implementations={
-                "Django ORM": django_limit,
-                "Djazzle": djazzle_first_100,
-                "Djazzle+psycopg2": djazzle_psycopg2_first_100,
-                "Djazzle+psycopg3": djazzle_psycopg3_first_100,
-            },
-            iterations=iterations,
-            warmup=10
+    if is_postgres_configured():
+        _copy_test_data(num_records)
+        print(f"Created {User.objects.count()} test records\n")
+        return
+
+    from django.db import connection
+
+    # Insert the generated rows with a single executemany() in one transaction.
+    # Unlike bulk_create(), no model instances are built, and the driver
+    # consumes the generator lazily so memory stays flat for any num_records.
+    table = connection.ops.quote_name(User._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(f) for f in _TEST_USER_FIELDS)
+    placeholders = ", ".join(["%s"] * len(_TEST_USER_FIELDS))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Clear existing data with one unconditional DELETE, which SQLite
+        # runs as a truncate (QuerySet.delete() would first collect every row)
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            _test_user_rows(num_records),
         )
-    else:
+
+    print(f"Created {User.objects.count()} test records\n")
+
+
+# Benchmarks (by number) that query the rows created by setup_test_data
+_READ_BENCHMARKS = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 13, 14, 15})
+
+
+def run_all_benchmarks(
+    num_records: int = 10000,
+    iterations: int = 100,
+    output_dir: str = "benchmark_results",
+    use_postgres: bool = False,
+    only: Optional[Set[int]] = None,
+    skip: Optional[Set[int]] = None
+) -> BenchmarkRunner:
+    """
+    Run all benchmarks comparing Djazzle and Django ORM.
+
+    Args:
+        num_records: Number of records to create for testing
+        iterations: Number of iterations per benchmark
+        output_dir: Directory to save results
+        use_postgres: Whether to include psycopg2/psycopg3 benchmarks (requires PostgreSQL)
+        only: Benchmark numbers to run (default: all)
+        skip: Benchmark numbers to leave out
+
+    Returns:
+        BenchmarkRunner with all results
+    """
+    def should_run(number: int) -> bool:
+        return (only is None or number in only) and (not skip or number not in skip)
+
+    # Setup. The write benchmarks create their own rows, so the test data is
+    # only loaded when a benchmark that reads it is selected.
+    if any(should_run(number) for number in _READ_BENCHMARKS):
+        setup_test_data(num_records)
+    runner = BenchmarkRunner(output_dir=output_dir)
+
+    print("Running benchmarks...\n")
+
+    # Table and query objects for the read benchmarks (1-8) are built once,
+    # outside the timed calls, so each iteration measures execution only.
+    # A DjazzleQuery is callable and is timed directly; Django querysets are
+    # cloned with .all() per call to bypass their result cache.
+    users_table = TableFromModel(User)
+
+    # Check if we should run psycopg benchmarks (only if postgres is configured)
+    run_psycopg_benchmarks = use_postgres and is_postgres_configured()
+    num_tests = 15 if run_psycopg_benchmarks else 13
+
+    # Benchmark 1: Select All Records
+    if should_run(1):
+        print(f"1/{num_tests} Select all records...")
+
+        django_all_qs = User.objects.all()
+        djazzle_all_q = DjazzleQuery().select().from_(users_table)
+
+        django_select_all = partial(_fetch_queryset, django_all_qs)
+        djazzle_select_all = djazzle_all_q
+
+        if run_psycopg_benchmarks:
+            psycopg2_all_q = DjazzleQuery(conn=get_psycopg2_connection()).select().from_(users_table)
+            psycopg3_all_q = DjazzleQuery(conn=get_psycopg3_connection()).select().from_(users_table)
+
+            djazzle_psycopg2_select_all = psycopg2_all_q
+            djazzle_psycopg3_select_all = psycopg3_all_q
+
+            runner.run_multi_comparison(
+                name="Select All Records",
+                description=f"Fetch all {num_records} records from database",
+                implementations={
+                    "Django ORM": django_select_all,
+                    "Djazzle": djazzle_select_all,
+                    "Djazzle+psycopg2": djazzle_psycopg2_select_all,
+                    "Djazzle+psycopg3": djazzle_psycopg3_select_all,
+                },
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="Select All Records",
+                description=f"Fetch all {num_records} records from database",
+                django_func=django_select_all,
+                djazzle_func=djazzle_select_all,
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
+
+    # Benchmark 2: Select All Records (streaming)
+    if should_run(2):
+        print(f"2/{num_tests} Select all records (streaming)...")
+
+        # Both sides stream from a cursor in chunks of 2000 rows: Django builds model
+        # instances (a server-side cursor on PostgreSQL), Djazzle builds dicts
+        # from fetchmany() batches.
+        django_all_iter = partial(_iterate_queryset, User.objects.all(), 2000)
+        djazzle_all_iter = partial(_iterate_djazzle, DjazzleQuery().select().from_(users_table), 2000)
+
         runner.run_comparison(
-            name="First 100 Records",
-            description="Fetch only first 100 records",
-            django_func=django_limit,
-            djazzle_func=djazzle_first_100,
-            iterations=iterations,
-            warmup=10
+            name="Select All Records (streaming)",
+            description=f"Stream all {num_records} records with iterator()",
+            django_func=django_all_iter,
+            djazzle_func=djazzle_all_iter,
+            iterations=iterations // 2,
+            warmup=5,
+            warmup_first_only=True
         )
 
-    # Benchmark 6: Order by name desc
-    print(f"6/{num_tests} Order by name desc")
+    # Benchmark 3: Filtered Query (Single Match)
+    if should_run(3):
+        print(f"3/{num_tests} Filtered query (single match)...")
+
+        # Conditions are plain values, shared by every Djazzle variant of a benchmark
+        name_is_user10 = eq(users_table.name, "User10")
+
+        django_filtered_qs = User.objects.filter(name="User10")
+        djazzle_filtered_q = DjazzleQuery().select().from_(users_table).where(name_is_user10)
+
+        django_filtered_single = partial(_fetch_queryset, django_filtered_qs)
+        djazzle_filtered_single = djazzle_filtered_q
+
+        if run_psycopg_benchmarks:
+            psycopg2_filtered_q = DjazzleQuery(conn=get_psycopg2_connection()).select().from_(users_table).where(name_is_user10)
+            psycopg3_filtered_q = DjazzleQuery(conn=get_psycopg3_connection()).select().from_(users_table).where(name_is_user10)
+
+            djazzle_psycopg2_filtered_single = psycopg2_filtered_q
+            djazzle_psycopg3_filtered_single = psycopg3_filtered_q
+
+            runner.run_multi_comparison(
+                name="Filtered Query (Single Match)",
+                description="WHERE clause returning 1 record",
+                implementations={
+                    "Django ORM": django_filtered_single,
+                    "Djazzle": djazzle_filtered_single,
+                    "Djazzle+psycopg2": djazzle_psycopg2_filtered_single,
+                    "Djazzle+psycopg3": djazzle_psycopg3_filtered_single,
+                },
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="Filtered Query (Single Match)",
+                description="WHERE clause returning 1 record",
+                django_func=django_filtered_single,
+                djazzle_func=djazzle_filtered_single,
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
 
-    def django_order_by():
-        dj_results = list(User.objects.order_by("-name"))
-        return dj_results
+    # Benchmark 4: Select Specific Columns
+    if should_run(4):
+        print(f"4/{num_tests} Select specific columns...")
+
+        django_columns_qs = User.objects.values("id", "name", "email")
+        djazzle_columns_q = DjazzleQuery().select("id", "name", "email").from_(users_table)
+
+        django_select_columns = partial(_fetch_queryset, django_columns_qs)
+        djazzle_select_columns = djazzle_columns_q
+
+        if run_psycopg_benchmarks:
+            psycopg2_columns_q = DjazzleQuery(conn=get_psycopg2_connection()).select("id", "name", "email").from_(users_table)
+            psycopg3_columns_q = DjazzleQuery(conn=get_psycopg3_connection()).select("id", "name", "email").from_(users_table)
+
+            djazzle_psycopg2_select_columns = psycopg2_columns_q
+            djazzle_psycopg3_select_columns = psycopg3_columns_q
+
+            runner.run_multi_comparison(
+                name="Select Specific Columns",
+                description=f"Select 3 columns from {num_records} records",
+                implementations={
+                    "Django ORM": django_select_columns,
+                    "Djazzle": djazzle_select_columns,
+                    "Djazzle+psycopg2": djazzle_psycopg2_select_columns,
+                    "Djazzle+psycopg3": djazzle_psycopg3_select_columns,
+                },
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="Select Specific Columns",
+                description=f"Select 2 columns from {num_records} records",
+                django_func=django_select_columns,
+                djazzle_func=djazzle_select_columns,
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
 
-    def djazzle_order_by():
-        dz_results = DjazzleQuery().select().from_(users_table).order_by(desc(users_table.name))()
-        return dz_results
+    # Benchmark 5: Select Specific Columns as tuples
+    if should_run(5):
+        print(f"5/{num_tests} Select specific columns (tuples)...")
+
+        # Same query as above without a dict per row, on both sides
+        django_tuples_qs = User.objects.values_list("id", "name", "email")
+        djazzle_tuples_q = DjazzleQuery().select("id", "name", "email").from_(users_table).as_tuples()
+
+        django_select_tuples = partial(_fetch_queryset, django_tuples_qs)
+        djazzle_select_tuples = djazzle_tuples_q
+
+        if run_psycopg_benchmarks:
+            djazzle_psycopg2_select_tuples = DjazzleQuery(conn=get_psycopg2_connection()).select(
+                "id", "name", "email"
+            ).from_(users_table).as_tuples()
+            djazzle_psycopg3_select_tuples = DjazzleQuery(conn=get_psycopg3_connection()).select(
+                "id", "name", "email"
+            ).from_(users_table).as_tuples()
+
+            runner.run_multi_comparison(
+                name="Select Specific Columns (tuples)",
+                description=f"Select 3 columns from {num_records} records as tuples",
+                implementations={
+                    "Django ORM": django_select_tuples,
+                    "Djazzle": djazzle_select_tuples,
+                    "Djazzle+psycopg2": djazzle_psycopg2_select_tuples,
+                    "Djazzle+psycopg3": djazzle_psycopg3_select_tuples,
+                },
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="Select Specific Columns (tuples)",
+                description=f"Select 3 columns from {num_records} records as tuples",
+                django_func=django_select_tuples,
+                djazzle_func=djazzle_select_tuples,
+                iterations=iterations // 2,
+                warmup=5,
+                warmup_first_only=True
+            )
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_order_by():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).order_by(desc(users_table.name))()
+    # Benchmark 6: Return Model Instances
+    if should_run(6):
+        print(f"6/{num_tests} Return 50 rows as model instances...")
 
-        def djazzle_psycopg3_order_by():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).select().from_(users_table).order_by(desc(users_table.name))()
+        django_models_qs = User.objects.all()[:50]
+        djazzle_models_q = DjazzleQuery().select().from_(users_table).as_model().limit(50)
+
+        django_as_models = partial(_fetch_queryset, django_models_qs)
+        djazzle_as_models = djazzle_models_q
 
-        runner.run_multi_comparison(
-            name="Order By",
-            description="Order by name descending",
-            implementations={
-                "Django ORM": django_order_by,
-                "Djazzle": djazzle_order_by,
-                "Djazzle+psycopg2": djazzle_psycopg2_order_by,
-                "Djazzle+psycopg3": djazzle_psycopg3_order_by,
-            },
-            iterations=iterations,
-            warmup=10
-        )
-    else:
         runner.run_comparison(
-            name="Order By",
-            description="Order by",
-            django_func=django_order_by,
-            djazzle_func=djazzle_order_by,
+            name="Return 50 Model Instances",
+            description="Query returning 50 rows as Django model instances",
+            django_func=django_as_models,
+            djazzle_func=djazzle_as_models,
             iterations=iterations,
-            warmup=10
+            warmup=10,
+            warmup_first_only=True
         )
 
-    # Benchmark 7: INSERT Single Record
-    print(f"7/{num_tests} INSERT single record...")
+    # Benchmark 7: First N Records
+    if should_run(7):
+        print(f"7/{num_tests} First N records...")
+
+        django_limit_qs = User.objects.all()[:100]
+        djazzle_limit_q = DjazzleQuery().select().from_(users_table).limit(100)
+
+        django_limit = partial(_fetch_queryset, django_limit_qs)
+        djazzle_first_100 = djazzle_limit_q
+
+        if run_psycopg_benchmarks:
+            psycopg2_limit_q = DjazzleQuery(conn=get_psycopg2_connection()).select().from_(users_table).limit(100)
+            psycopg3_limit_q = DjazzleQuery(conn=get_psycopg3_connection()).select().from_(users_table).limit(100)
+
+            djazzle_psycopg2_first_100 = psycopg2_limit_q
+            djazzle_psycopg3_first_100 = psycopg3_limit_q
+
+            runner.run_multi_comparison(
+                name="First 100 Records",
+                description="Fetch only first 100 records",
+                implementations={
+                    "Django ORM": django_limit,
+                    "Djazzle": djazzle_first_100,
+                    "Djazzle+psycopg2": djazzle_psycopg2_first_100,
+                    "Djazzle+psycopg3": djazzle_psycopg3_first_100,
+                },
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="First 100 Records",
+                description="Fetch only first 100 records",
+                django_func=django_limit,
+                djazzle_func=djazzle_first_100,
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
 
-    # Track IDs to delete later
-    django_insert_ids = []
-    djazzle_insert_ids = []
+    # Benchmark 8: Order by name desc
+    if should_run(8):
+        print(f"8/{num_tests} Order by name desc")
+
+        django_order_qs = User.objects.order_by("-name")
+        name_desc = desc(users_table.name)
+        djazzle_order_q = DjazzleQuery().select().from_(users_table).order_by(name_desc)
+
+        django_order_by = partial(_fetch_queryset, django_order_qs)
+        djazzle_order_by = djazzle_order_q
+
+        if run_psycopg_benchmarks:
+            psycopg2_order_q = DjazzleQuery(conn=get_psycopg2_connection()).select().from_(users_table).order_by(name_desc)
+            psycopg3_order_q = DjazzleQuery(conn=get_psycopg3_connection()).select().from_(users_table).order_by(name_desc)
+
+            djazzle_psycopg2_order_by = psycopg2_order_q
+            djazzle_psycopg3_order_by = psycopg3_order_q
+
+            runner.run_multi_comparison(
+                name="Order By",
+                description="Order by name descending",
+                implementations={
+                    "Django ORM": django_order_by,
+                    "Djazzle": djazzle_order_by,
+                    "Djazzle+psycopg2": djazzle_psycopg2_order_by,
+                    "Djazzle+psycopg3": djazzle_psycopg3_order_by,
+                },
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
+        else:
+            runner.run_comparison(
+                name="Order By",
+                description="Order by",
+                django_func=django_order_by,
+                djazzle_func=djazzle_order_by,
+                iterations=iterations,
+                warmup=10,
+                warmup_first_only=True
+            )
 
-    def django_insert():
-        user = User.objects.create(
-            name="BenchmarkUser",
-            age=30,
-            email="benchmark@test.com",
-            username="benchmark_user",
-            address="123 Benchmark St"
-        )
-        django_insert_ids.append(user.id)
-        return [user]
+    # Benchmark 9: INSERT Single Record
+    if should_run(9):
+        print(f"9/{num_tests} INSERT single record...")
 
-    def djazzle_insert():
-        # Note: We can't use returning() for MySQL compatibility
-        # So we'll just do the insert without returning
-        result = DjazzleQuery().insert(users_table).values({
+        insert_values = {
             "name": "BenchmarkUser",
             "age": 30,
             "email": "benchmark@test.com",
             "username": "benchmark_user",
             "address": "123 Benchmark St"
-        })()
-        return result
+        }
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_insert():
-            conn = get_psycopg2_connection()
-            result = DjazzleQuery(conn=conn).insert(users_table).values({
-                "name": "BenchmarkUser",
-                "age": 30,
-                "email": "benchmark@test.com",
-                "username": "benchmark_user",
-                "address": "123 Benchmark St"
-            })()
-            return result
-
-        def djazzle_psycopg3_insert():
-            conn = get_psycopg3_connection()
-            result = DjazzleQuery(conn=conn).insert(users_table).values({
-                "name": "BenchmarkUser",
-                "age": 30,
-                "email": "benchmark@test.com",
-                "username": "benchmark_user",
-                "address": "123 Benchmark St"
-            })()
-            return result
+        django_insert = partial(_django_create, insert_values)
+        # Note: We can't use returning() for MySQL compatibility
+        # So we'll just do the insert without returning
+        djazzle_insert = _djazzle_insert(users_table, insert_values)
 
-        runner.run_multi_comparison(
-            name="INSERT Single Record",
-            description="Insert one record into database",
-            implementations={
-                "Django ORM": django_insert,
-                "Djazzle": djazzle_insert,
-                "Djazzle+psycopg2": djazzle_psycopg2_insert,
-                "Djazzle+psycopg3": djazzle_psycopg3_insert,
-            },
-            iterations=iterations,
-            warmup=10
-        )
-    else:
-        runner.run_comparison(
-            name="INSERT Single Record",
-            description="Insert one record into database",
-            django_func=django_insert,
-            djazzle_func=djazzle_insert,
-            iterations=iterations,
-            warmup=10
-        )
+        if run_psycopg_benchmarks:
+            djazzle_psycopg2_insert = _djazzle_insert(
+                users_table, insert_values, conn=get_psycopg2_connection()
+            )
+            djazzle_psycopg3_insert = _djazzle_insert(
+                users_table, insert_values, conn=get_psycopg3_connection()
+            )
 
-    # Clean up inserted records
-    User.objects.filter(name="BenchmarkUser").delete()
+            runner.run_multi_comparison(
+                name="INSERT Single Record",
+                description="Insert one record into database",
+                implementations={
+                    "Django ORM": django_insert,
+                    "Djazzle": djazzle_insert,
+                    "Djazzle+psycopg2": djazzle_psycopg2_insert,
+                    "Djazzle+psycopg3": djazzle_psycopg3_insert,
+                },
+                iterations=iterations,
+                warmup=10,
+                wrap_in_transaction=_ROLLED_BACK_WRITES
+            )
+        else:
+            runner.run_comparison(
+                name="INSERT Single Record",
+                description="Insert one record into database",
+                django_func=django_insert,
+                djazzle_func=djazzle_insert,
+                iterations=iterations,
+                warmup=10,
+                wrap_in_transaction=True
+            )
 
-    # Benchmark 8: UPDATE Single Record
-    print(f"8/{num_tests} UPDATE single record...")
+        # Clean up inserted records
+        User.objects.filter(name="BenchmarkUser").delete()
 
-    # Create a record to update
-    test_user = User.objects.create(
-        name="UpdateTest",
-        age=25,
-        email="update@test.com",
-        username="update_test",
-        address="456 Update St"
-    )
+    # Benchmark 10: UPDATE Single Record
+    if should_run(10):
+        print(f"10/{num_tests} UPDATE single record...")
 
-    def django_update():
-        User.objects.filter(id=test_user.id).update(age=26)
-        return None
+        # Create a record to update
+        test_user = User.objects.create(
+            name="UpdateTest",
+            age=25,
+            email="update@test.com",
+            username="update_test",
+            address="456 Update St"
+        )
 
-    def djazzle_update():
-        result = DjazzleQuery().update(users_table).set({"age": 26}).where(
-            eq(users_table.id, test_user.id)
-        )()
-        return result
+        update_condition = eq(users_table.id, test_user.id)
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_update():
-            conn = get_psycopg2_connection()
-            return DjazzleQuery(conn=conn).update(users_table).set({"age": 26}).where(
-                eq(users_table.id, test_user.id)
-            )()
-
-        def djazzle_psycopg3_update():
-            conn = get_psycopg3_connection()
-            return DjazzleQuery(conn=conn).update(users_table).set({"age": 26}).where(
-                eq(users_table.id, test_user.id)
-            )()
+        django_update = partial(_django_update, {"id": test_user.id}, {"age": 26})
+        djazzle_update = _djazzle_update(users_table, {"age": 26}, update_condition)
 
-        runner.run_multi_comparison(
-            name="UPDATE Single Record",
-            description="Update one record in database",
-            implementations={
-                "Django ORM": django_update,
-                "Djazzle": djazzle_update,
-                "Djazzle+psycopg2": djazzle_psycopg2_update,
-                "Djazzle+psycopg3": djazzle_psycopg3_update,
-            },
-            iterations=iterations,
-            warmup=10
-        )
-    else:
-        runner.run_comparison(
-            name="UPDATE Single Record",
-            description="Update one record in database",
-            django_func=django_update,
-            djazzle_func=djazzle_update,
-            iterations=iterations,
-            warmup=10
+        if run_psycopg_benchmarks:
+            djazzle_psycopg2_update = _djazzle_update(
+                users_table, {"age": 26}, update_condition,
+                conn=get_psycopg2_connection()
+            )
+            djazzle_psycopg3_update = _djazzle_update(
+                users_table, {"age": 26}, update_condition,
+                conn=get_psycopg3_connection()
+            )
+
+            runner.run_multi_comparison(
+                name="UPDATE Single Record",
+                description="Update one record in database",
+                implementations={
+                    "Django ORM": django_update,
+                    "Djazzle": djazzle_update,
+                    "Djazzle+psycopg2": djazzle_psycopg2_update,
+                    "Djazzle+psycopg3": djazzle_psycopg3_update,
+                },
+                iterations=iterations,
+                warmup=10,
+                wrap_in_transaction=_ROLLED_BACK_WRITES
+            )
+        else:
+            runner.run_comparison(
+                name="UPDATE Single Record",
+                description="Update one record in database",
+                django_func=django_update,
+                djazzle_func=djazzle_update,
+                iterations=iterations,
+                warmup=10,
+                wrap_in_transaction=True
+            )
+
+        # Clean up test user
+        test_user.delete()
+
+    # Benchmark 11: Bulk INSERT (100 records)
+    if should_run(11):
+        print(f"11/{num_tests} Bulk INSERT (100 records)...")
+
+        # Inserted rows are deleted after each call, outside the timed region.
+        # A DjazzleQuery is callable, so a prebuilt DELETE serves as the cleanup.
+        # Every inserted row gets an id above the current maximum, so the cleanup
+        # is a primary-key range delete instead of a LIKE scan over the table.
+        max_user_id = User.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        is_bulk_user = gt(users_table.id, max_user_id)
+
+        def delete_bulk_users(conn=None):
+            return DjazzleQuery(conn=conn).delete(users_table).where(is_bulk_user)
+
+        # Payload is generated once, outside the timed calls. It is built column-wise
+        # (in _TEST_USER_FIELDS order) and zipped into row tuples for the raw-driver
+        # variants, dicts for Djazzle and model instances for Django.
+        bulk_columns = (
+            [f"BulkUser{i}" for i in range(100)],
+            [20 + (i % 50) for i in range(100)],
+            [f"bulk{i}@test.com" for i in range(100)],
+            [f"bulk_user_{i}" for i in range(100)],
+            [f"{i} Bulk St" for i in range(100)],
         )
+        bulk_rows = list(zip(*bulk_columns))
+        bulk_values = [dict(zip(_TEST_USER_FIELDS, row)) for row in bulk_rows]
+
+        bulk_models = [User(**row) for row in bulk_values]
+        delete_bulk_users_q = delete_bulk_users()
+
+        def reset_bulk_models():
+            # bulk_create() assigns pks to the instances; clear them again so the
+            # same instances are inserted as new rows on the next call
+            delete_bulk_users_q()
+            for user in bulk_models:
+                user.pk = None
+                user._state.adding = True
+
+        django_bulk_insert = partial(_django_bulk_create, bulk_models)
+        djazzle_bulk_insert = _djazzle_insert(users_table, bulk_values)
+
+        if run_psycopg_benchmarks:
+            # The raw-driver variants take the fastest bulk path each driver offers:
+            # execute_values() for psycopg2 and binary COPY for psycopg3. Both are fed
+            # the same payload as row tuples, in _TEST_USER_FIELDS order.
+            djazzle_psycopg2_bulk_insert = partial(
+                bulk_insert_with_execute_values,
+                get_psycopg2_connection(), users_table.db_table_name, _TEST_USER_FIELDS, bulk_rows
+            )
+            djazzle_psycopg3_bulk_insert = partial(
+                bulk_insert_with_copy,
+                get_psycopg3_connection(), users_table.db_table_name, _TEST_USER_FIELDS,
+                bulk_rows, types=_TEST_USER_COPY_TYPES
+            )
 
-    # Clean up test user
-    test_user.delete()
+            runner.run_multi_comparison(
+                name="Bulk INSERT (100 records)",
+                description="Insert 100 records in one operation",
+                implementations={
+                    "Django ORM": django_bulk_insert,
+                    "Djazzle": djazzle_bulk_insert,
+                    "Djazzle+psycopg2": djazzle_psycopg2_bulk_insert,
+                    "Djazzle+psycopg3": djazzle_psycopg3_bulk_insert,
+                },
+                iterations=iterations // 2,  # Fewer iterations for bulk operations
+                warmup=5,
+                wrap_in_transaction=_ROLLED_BACK_WRITES,
+                cleanup={
+                    "Django ORM": reset_bulk_models,
+                    "Djazzle": delete_bulk_users_q,
+                    "Djazzle+psycopg2": delete_bulk_users(get_psycopg2_connection()),
+                    "Djazzle+psycopg3": delete_bulk_users(get_psycopg3_connection()),
+                }
+            )
+        else:
+            runner.run_comparison(
+                name="Bulk INSERT (100 records)",
+                description="Insert 100 records in one operation",
+                django_func=django_bulk_insert,
+                djazzle_func=djazzle_bulk_insert,
+                iterations=iterations // 2,  # Fewer iterations for bulk operations
+                warmup=5,
+                wrap_in_transaction=True,
+                cleanup=reset_bulk_models
+            )
 
-    # Benchmark 9: Bulk INSERT (100 records)
-    print(f"9/{num_tests} Bulk INSERT (100 records)...")
+    # Benchmark 12: Bulk UPDATE (100 records)
+    if should_run(12):
+        print(f"12/{num_tests} Bulk UPDATE (100 records)...")
+
+        # Create 100 records to update
+        bulk_update_users = []
+        for i in range(100):
+            bulk_update_users.append(
+                User(
+                    name=f"UpdateBulk{i}",
+                    age=20,
+                    email=f"updatebulk{i}@test.com",
+                    username=f"update_bulk_{i}",
+                    address=f"{i} Update St"
+                )
+            )
+        User.objects.bulk_create(bulk_update_users)
 
-    def django_bulk_insert():
-        users = [
-            User(
-                name=f"BulkUser{i}",
-                age=20 + (i % 50),
-                email=f"bulk{i}@test.com",
-                username=f"bulk_user_{i}",
-                address=f"{i} Bulk St"
+        # Get the IDs after creation
+        update_user_ids = list(User.objects.filter(name__startswith="UpdateBulk").values_list('id', flat=True))
+
+        # Ages are reset after each call, outside the timed region. Each timed call is
+        # therefore a single UPDATE (one round-trip), so batching with psycopg3's
+        # pipeline mode would have nothing to pipeline here.
+        # Update all records with name starting with UpdateBulk
+        bulk_update_condition = like(users_table.name, "UpdateBulk%")
+
+        # The reset targets the known ids rather than repeating the LIKE scan
+        def reset_bulk_update_ages(conn=None):
+            return DjazzleQuery(conn=conn).update(users_table).set({"age": 20}).where(
+                in_array(users_table.id, update_user_ids)
             )
-            for i in range(100)
-        ]
-        created = User.objects.bulk_create(users)
-        # Delete immediately to avoid bloat
-        User.objects.filter(name__startswith="BulkUser").delete()
-        return created
-
-    def djazzle_bulk_insert():
-        values = [
-            {
-                "name": f"BulkUser{i}",
-                "age": 20 + (i % 50),
-                "email": f"bulk{i}@test.com",
-                "username": f"bulk_user_{i}",
-                "address": f"{i} Bulk St"
-            }
-            for i in range(100)
-        ]
-        result = DjazzleQuery().insert(users_table).values(values)()
-        # Delete immediately to avoid bloat
-        User.objects.filter(name__startswith="BulkUser").delete()
-        return result
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_bulk_insert():
-            conn = get_psycopg2_connection()
-            values = [
-                {
-                    "name": f"BulkUser{i}",
-                    "age": 20 + (i % 50),
-                    "email": f"bulk{i}@test.com",
-                    "username": f"bulk_user_{i}",
-                    "address": f"{i} Bulk St"
-                }
-                for i in range(100)
-            ]
-            result = DjazzleQuery(conn=conn).insert(users_table).values(values)()
-            # Delete immediately to avoid bloat
-            User.objects.filter(name__startswith="BulkUser").delete()
-            return result
-
-        def djazzle_psycopg3_bulk_insert():
-            conn = get_psycopg3_connection()
-            values = [
-                {
-                    "name": f"BulkUser{i}",
-                    "age": 20 + (i % 50),
-                    "email": f"bulk{i}@test.com",
-                    "username": f"bulk_user_{i}",
-                    "address": f"{i} Bulk St"
-                }
-                for i in range(100)
-            ]
-            result = DjazzleQuery(conn=conn).insert(users_table).values(values)()
-            # Delete immediately to avoid bloat
-            User.objects.filter(name__startswith="BulkUser").delete()
-            return result
+        django_bulk_update = partial(_django_update, {"name__startswith": "UpdateBulk"}, {"age": 25})
+        djazzle_bulk_update = _djazzle_update(users_table, {"age": 25}, bulk_update_condition)
 
-        runner.run_multi_comparison(
-            name="Bulk INSERT (100 records)",
-            description="Insert 100 records in one operation",
-            implementations={
-                "Django ORM": django_bulk_insert,
-                "Djazzle": djazzle_bulk_insert,
-                "Djazzle+psycopg2": djazzle_psycopg2_bulk_insert,
-                "Djazzle+psycopg3": djazzle_psycopg3_bulk_insert,
-            },
-            iterations=iterations // 2,  # Fewer iterations for bulk operations
-            warmup=5
-        )
-    else:
-        runner.run_comparison(
-            name="Bulk INSERT (100 records)",
-            description="Insert 100 records in one operation",
-            django_func=django_bulk_insert,
-            djazzle_func=djazzle_bulk_insert,
-            iterations=iterations // 2,  # Fewer iterations for bulk operations
-            warmup=5
-        )
+        if run_psycopg_benchmarks:
+            djazzle_psycopg2_bulk_update = _djazzle_update(
+                users_table, {"age": 25}, bulk_update_condition,
+                conn=get_psycopg2_connection()
+            )
+            djazzle_psycopg3_bulk_update = _djazzle_update(
+                users_table, {"age": 25}, bulk_update_condition,
+                conn=get_psycopg3_connection()
+            )
 
-    # Benchmark 10: Bulk UPDATE (100 records)
-    print(f"10/{num_tests} Bulk UPDATE (100 records)...")
-
-    # Create 100 records to update
-    bulk_update_users = []
-    for i in range(100):
-        bulk_update_users.append(
-            User(
-                name=f"UpdateBulk{i}",
-                age=20,
-                email=f"updatebulk{i}@test.com",
-                username=f"update_bulk_{i}",
-                address=f"{i} Update St"
+            runner.run_multi_comparison(
+                name="Bulk UPDATE (100 records)",
+                description="Update 100 records in one operation",
+                implementations={
+                    "Django ORM": django_bulk_update,
+                    "Djazzle": djazzle_bulk_update,
+                    "Djazzle+psycopg2": djazzle_psycopg2_bulk_update,
+                    "Djazzle+psycopg3": djazzle_psycopg3_bulk_update,
+                },
+                iterations=iterations // 2,  # Fewer iterations for bulk operations
+                warmup=5,
+                wrap_in_transaction=_ROLLED_BACK_WRITES,
+                cleanup={
+                    "Django ORM": reset_bulk_update_ages(),
+                    "Djazzle": reset_bulk_update_ages(),
+                    "Djazzle+psycopg2": reset_bulk_update_ages(get_psycopg2_connection()),
+                    "Djazzle+psycopg3": reset_bulk_update_ages(get_psycopg3_connection()),
+                }
+            )
+        else:
+            runner.run_comparison(
+                name="Bulk UPDATE (100 records)",
+                description="Update 100 records in one operation",
+                django_func=django_bulk_update,
+                djazzle_func=djazzle_bulk_update,
+                iterations=iterations // 2,  # Fewer iterations for bulk operations
+                warmup=5,
+                wrap_in_transaction=True,
+                cleanup=reset_bulk_update_ages()
             )
-        )
-    User.objects.bulk_create(bulk_update_users)
 
-    # Get the IDs after creation
-    update_user_ids = list(User.objects.filter(name__startswith="UpdateBulk").values_list('id', flat=True))
+        # Clean up bulk update test records
+        User.objects.filter(name__startswith="UpdateBulk").delete()
 
-    def django_bulk_update():
-        User.objects.filter(name__startswith="UpdateBulk").update(age=25)
-        # Reset for next iteration
-        User.objects.filter(name__startswith="UpdateBulk").update(age=20)
-        return None
+    # Benchmark 13: Select All Records as tuples
+    if should_run(13):
+        print(f"13/{num_tests} Select all records (tuples)...")
 
-    def djazzle_bulk_update():
-        # Update all records with name starting with UpdateBulk
-        result = DjazzleQuery().update(users_table).set({"age": 25}).where(
-            like(users_table.name, "UpdateBulk%")
-        )()
-        # Reset for next iteration
-        DjazzleQuery().update(users_table).set({"age": 20}).where(
-            like(users_table.name, "UpdateBulk%")
-        )()
-        return result
+        # Both sides return the same materialized list of row tuples, so the
+        # difference left is the per-row decoding cost of each stack
+        all_fields = [field.attname for field in User._meta.concrete_fields]
+        django_all_tuples = partial(_fetch_queryset, User.objects.values_list(*all_fields))
+        djazzle_all_tuples = DjazzleQuery().select(*all_fields).from_(users_table).as_tuples()
 
-    if run_psycopg_benchmarks:
-        def djazzle_psycopg2_bulk_update():
-            conn = get_psycopg2_connection()
-            result = DjazzleQuery(conn=conn).update(users_table).set({"age": 25}).where(
-                like(users_table.name, "UpdateBulk%")
-            )()
-            # Reset for next iteration
-            DjazzleQuery(conn=conn).update(users_table).set({"age": 20}).where(
-                like(users_table.name, "UpdateBulk%")
-            )()
-            return result
-
-        def djazzle_psycopg3_bulk_update():
-            conn = get_psycopg3_connection()
-            result = DjazzleQuery(conn=conn).update(users_table).set({"age": 25}).where(
-                like(users_table.name, "UpdateBulk%")
-            )()
-            # Reset for next iteration
-            DjazzleQuery(conn=conn).update(users_table).set({"age": 20}).where(
-                like(users_table.name, "UpdateBulk%")
-            )()
-            return result
+        runner.run_comparison(
+            name="Select All Records (tuples)",
+            description=f"Fetch all {num_records} records as row tuples",
+            django_func=django_all_tuples,
+            djazzle_func=djazzle_all_tuples,
+            iterations=iterations // 2,
+            warmup=5,
+            warmup_first_only=True
+        )
+
+    # Benchmark 14: Concurrent Select (psycopg3 only, needs psycopg_pool)
+    if run_psycopg_benchmarks and should_run(14):
+        print(f"14/{num_tests} Concurrent select (8 workers)...")
+
+        # Eight filtered selects per call: one after another (Django ORM and the
+        # single psycopg3 connection), or spread over 8 threads that each check
+        # a connection out of a psycopg_pool pool.
+        concurrency = 8
+        name_is_user10 = eq(users_table.name, "User10")
+        django_filtered_single = partial(_fetch_queryset, User.objects.filter(name="User10"))
+        djazzle_psycopg3_filtered_single = DjazzleQuery(conn=get_psycopg3_connection()).select().from_(
+            users_table
+        ).where(name_is_user10)
+
+        try:
+            pool = get_psycopg3_pool(min_size=concurrency, max_size=concurrency)
+        except ImportError:
+            print("  skipped: install psycopg-pool to run it")
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Each call checks a connection out of the pool and returns it afterwards
+            pooled_select = DjazzleQuery(conn=pool).select().from_(users_table).where(name_is_user10)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                runner.run_multi_comparison(
+                    name="Concurrent Select (8 workers)",
+                    description=f"{concurrency} filtered selects, serial vs. pooled threads",
+                    implementations={
+                        "Django ORM": partial(_run_serially, django_filtered_single, concurrency),
+                        "Djazzle+psycopg3 (serial)": partial(
+                            _run_serially, djazzle_psycopg3_filtered_single, concurrency
+                        ),
+                        "Djazzle+psycopg3 (pool)": partial(
+                            _run_concurrently, executor, pooled_select, concurrency
+                        ),
+                    },
+                    iterations=iterations,
+                    warmup=10
+                )
+
+    # Benchmark 15: Select All, text vs. binary result format (psycopg3 only)
+    if run_psycopg_benchmarks and should_run(15):
+        print(f"15/{num_tests} Select all records (binary results)...")
+
+        # Same four-column scan through the raw psycopg3 connection, fetched in
+        # the text and binary wire formats, plus a binary fetch transposed into
+        # column lists. Exposes the driver's decoding cost under Djazzle.
+        scan_fields = ("id", "name", "age", "email")
+        scan_sql = DjazzleQuery().select(*scan_fields).from_(users_table).sql
+        pg3_conn = get_psycopg3_connection()
 
         runner.run_multi_comparison(
-            name="Bulk UPDATE (100 records)",
-            description="Update 100 records in one operation",
+            name="Select All Records (binary results)",
+            description=f"Fetch 4 columns of {num_records} records, text vs. binary format",
             implementations={
-                "Django ORM": django_bulk_update,
-                "Djazzle": djazzle_bulk_update,
-                "Djazzle+psycopg2": djazzle_psycopg2_bulk_update,
-                "Djazzle+psycopg3": djazzle_psycopg3_bulk_update,
+                "Django ORM": partial(_fetch_queryset, User.objects.values_list(*scan_fields)),
+                "psycopg3 (text)": partial(_psycopg3_fetch, pg3_conn, scan_sql),
+                "psycopg3 (binary)": partial(_psycopg3_fetch, pg3_conn, scan_sql, binary=True),
+                "psycopg3 (binary, columnar)": partial(_psycopg3_fetch_columns, pg3_conn, scan_sql),
             },
-            iterations=iterations // 2,  # Fewer iterations for bulk operations
-            warmup=5
-        )
-    else:
-        runner.run_comparison(
-            name="Bulk UPDATE (100 records)",
-            description="Update 100 records in one operation",
-            django_func=django_bulk_update,
-            djazzle_func=djazzle_bulk_update,
-            iterations=iterations // 2,  # Fewer iterations for bulk operations
-            warmup=5
+            iterations=iterations // 2,
+            warmup=5,
+            warmup_first_only=True
         )
 
-    # Clean up bulk update test records
-    User.objects.filter(name__startswith="UpdateBulk").delete()
-
     # Clean up psycopg connections if they were used
     if run_psycopg_benchmarks:
         close_psycopg_connections()
@@ -3,8 +3,10 @@
 Standalone benchmark runner that properly sets up Django test database.
 """
 
+import json
 import os
 import time
+from pathlib import Path
 
 import django
 from django.conf import settings
@@ -13,15 +15,70 @@ from contextlib import contextmanager
 
 os.environ["DJANGO_SETTINGS_MODULE"] = "tests.test_settings"
 
+# State file describing a PostgreSQL container kept alive with --reuse-container
+CONTAINER_STATE_FILE = Path.home() / ".djazzle_bench.json"
+REUSED_CONTAINER_NAME = "djazzle-bench-pg"
+
+
+def _export_db_env(state: dict):
+    """Set the DB_* environment variables read by the test settings."""
+    os.environ["DB_HOST"] = state["host"]
+    os.environ["DB_PORT"] = str(state["port"])
+    os.environ["DB_NAME"] = state["dbname"]
+    os.environ["DB_USER"] = state["username"]
+    os.environ["DB_PASSWORD"] = state["password"]
+
+
+def stop_reused_container():
+    """Stop the container recorded by --reuse-container and forget it."""
+    if not CONTAINER_STATE_FILE.exists():
+        print("No reused PostgreSQL container to stop.")
+        return
+
+    import docker
+
+    state = json.loads(CONTAINER_STATE_FILE.read_text())
+    print(f"Stopping PostgreSQL container {state['container_id'][:12]}...")
+    try:
+        docker.from_env().containers.get(state["container_id"]).remove(force=True)
+    except docker.errors.NotFound:
+        pass
+    CONTAINER_STATE_FILE.unlink()
+
+
+def _running_container_state():
+    """Return the saved --reuse-container state if its container is still running."""
+    if not CONTAINER_STATE_FILE.exists():
+        return None
+
+    import docker
+
+    state = json.loads(CONTAINER_STATE_FILE.read_text())
+    try:
+        container = docker.from_env().containers.get(state["container_id"])
+    except docker.errors.NotFound:
+        container = None
+    if container is None or container.status != "running":
+        # Removed or stopped outside this script (e.g. docker restart); start afresh
+        print("Reused PostgreSQL container is gone, starting a new one")
+        if container is not None:
+            container.remove(force=True)
+        CONTAINER_STATE_FILE.unlink()
+        return None
+    return state
+
+
 @contextmanager
-def testcontainers_postgres(enabled: bool):
+def testcontainers_postgres(enabled: bool, reuse: bool = False):
     """Context manager to optionally start a PostgreSQL Testcontainer
 
     Args:
         enabled: Whether postgres is enabled
+        reuse: Keep the container running after exit and reuse it on later runs.
+            Its connection details are stored in ~/.djazzle_bench.json.
 
     Yields:
-        Container object (or None if not enabled)
+        Container object (or None if not enabled or an existing one is reused)
         Sets env vars DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
         Caller must update settings.DATABASES after django.setup()
     """
@@ -29,25 +86,72 @@ def testcontainers_postgres(enabled: bool):
         yield None
         return
 
+    state = _running_container_state() if reuse else None
+    if state is not None:
+        print(f"Reusing PostgreSQL container from {CONTAINER_STATE_FILE}")
+        _export_db_env(state)
+        yield None
+        return
+
+    if reuse:
+        # The Ryuk reaper would remove the container when this process exits
+        os.environ["TESTCONTAINERS_RYUK_DISABLED"] = "true"
+
     from testcontainers.postgres import PostgresContainer
 
     print("Starting PostgreSQL Testcontainer...")
     container = PostgresContainer(
         image="postgres:17", username="test", password="test", dbname="testdb"
     )
+    if reuse:
+        container.with_name(REUSED_CONTAINER_NAME)
     container.start()
     try:
+        state = {
+            "container_id": container.get_wrapped_container().id,
+            "host": container.get_container_host_ip(),
+            "port": container.get_exposed_port(5432),
+            "dbname": container.dbname,
+            "username": container.username,
+            "password": container.password,
+        }
         # Set environment variables for the caller to use
-        os.environ["DB_HOST"] = container.get_container_host_ip()
-        os.environ["DB_PORT"] = str(container.get_exposed_port(5432))
-        os.environ["DB_NAME"] = container.dbname
-        os.environ["DB_USER"] = container.username
-        os.environ["DB_PASSWORD"] = container.password
+        _export_db_env(state)
+        if reuse:
+            CONTAINER_STATE_FILE.write_text(json.dumps(state))
 
         yield container
     finally:
-        print("Stopping PostgreSQL Testcontainer...")
-        container.stop()
+        if reuse:
+            print("Leaving PostgreSQL Testcontainer running (stop with --stop-container)")
+        else:
+            print("Stopping PostgreSQL Testcontainer...")
+            container.stop()
+
+
+def skip_migrations():
+    """
+    Create the test schema directly from the models instead of migrating.
+
+    The benchmarks only need the model tables, so running every migration and the
+    contenttypes/auth post_migrate handlers (content types, permissions) is wasted
+    setup time. Must be called after django.setup() and before setup_databases().
+    """
+    from django.apps import apps
+    from django.contrib.auth.management import create_permissions
+    from django.contrib.contenttypes.management import create_contenttypes
+    from django.db.models.signals import post_migrate
+
+    settings.MIGRATION_MODULES = {app.label: None for app in apps.get_app_configs()}
+    post_migrate.disconnect(
+        create_permissions, dispatch_uid="django.contrib.auth.management.create_permissions"
+    )
+    post_migrate.disconnect(create_contenttypes)
+
+
+def _benchmark_numbers(value: str) -> set:
+    """Parse a comma-separated list of benchmark numbers."""
+    return {int(number) for number in value.split(",") if number.strip()}
 
 
 if __name__ == "__main__":
@@ -79,6 +183,32 @@ if __name__ == "__main__":
         action="store_true",
         help="Include psycopg2/psycopg3 benchmarks (requires --database=postgres)",
     )
+    parser.add_argument(
+        "--reuse-container",
+        action="store_true",
+        help="Keep the PostgreSQL container running and reuse it on later runs",
+    )
+    parser.add_argument(
+        "--keepdb",
+        action="store_true",
+        help="Keep the test database between runs instead of recreating and "
+        "migrating it (useful with --reuse-container)",
+    )
+    parser.add_argument(
+        "--stop-container",
+        action="store_true",
+        help="Stop the container kept by --reuse-container and exit",
+    )
+    parser.add_argument(
+        "--only",
+        type=_benchmark_numbers,
+        help="Comma-separated benchmark numbers to run, e.g. 1,3,11 (default: all)",
+    )
+    parser.add_argument(
+        "--skip",
+        type=_benchmark_numbers,
+        help="Comma-separated benchmark numbers to leave out",
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
@@ -94,6 +224,10 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    if args.stop_container:
+        stop_reused_container()
+        raise SystemExit(0)
+
     # Validate psycopg tests require postgres
     if args.include_psycopg_tests and args.database != "postgres":
         parser.error("--include-psycopg-tests requires --database=postgres")
@@ -102,8 +236,9 @@ if __name__ == "__main__":
     use_postgres = args.database == "postgres"
 
     # Configure Django (database settings picked up from environment variables)
-    with testcontainers_postgres(use_postgres):
+    with testcontainers_postgres(use_postgres, reuse=args.reuse_container):
         django.setup()
+        skip_migrations()
 
         if use_postgres:
             print(f"Database configured: postgresql://{os.environ['DB_USER']}@{os.environ['DB_HOST']}:{os.environ['DB_PORT']}/{os.environ['DB_NAME']}")
@@ -113,7 +248,7 @@ if __name__ == "__main__":
         # Setup test database
         print("Setting up test database...")
         TestRunner = get_runner(settings)
-        test_runner = TestRunner(verbosity=2, interactive=False, keepdb=False)
+        test_runner = TestRunner(verbosity=2, interactive=False, keepdb=args.keepdb)
         old_config = test_runner.setup_databases()
 
         # Debug: Print actual database connection settings
@@ -129,6 +264,8 @@ if __name__ == "__main__":
                 iterations=args.iterations,
                 output_dir=args.output_dir,
                 use_postgres=args.include_psycopg_tests,
+                only=args.only,
+                skip=args.skip,
             )
 
             # Print summary
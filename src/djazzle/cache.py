@@ -0,0 +1,109 @@
+"""Opt-in SELECT result cache, see DjazzleQuery.enable_result_cache()."""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from django.db.models.signals import post_delete, post_save
+
+
+# Returned by ResultCache.get() on a miss (None is a valid result)
+MISSING = object()
+
+
+def _copy_rows(rows: list) -> list:
+    """New list with new dict / model rows; tuple rows are immutable and shared."""
+    if not rows:
+        return list(rows)
+    first = rows[0]
+    if isinstance(first, dict):
+        return list(map(dict, rows))
+    if isinstance(first, tuple):
+        return list(rows)
+    return list(map(copy.copy, rows))
+
+
+def _row_width(row) -> int:
+    """Number of values in a dict, tuple or model instance row."""
+    if isinstance(row, (dict, tuple)):
+        return len(row)
+    return len(vars(row))
+
+
+class ResultCache:
+    """
+    LRU cache of query results keyed by (SQL, params), with per-table invalidation.
+
+    Entries for a table are dropped when a model instance of that table is
+    saved or deleted through the Django ORM (post_save / post_delete signals),
+    and when the owning DjazzleQuery runs an INSERT, UPDATE or DELETE on it.
+    Writes that send no signals (QuerySet.update(), bulk_create(), raw SQL,
+    other processes) are not seen; call clear() or invalidate() after them.
+
+    Results are copied into and out of the cache (new list, new dict / model
+    rows), so callers can't change what later callers get.
+
+    Thread-safe: the signal receivers run in whichever thread saves a model,
+    so every access to the entries holds a lock.
+    """
+
+    def __init__(self, maxsize: int = 256, max_cells: int | None = 100_000):
+        """
+        Args:
+            maxsize: Maximum number of cached results (least recently used go first)
+            max_cells: Results with more values than this (rows x columns) are
+                not cached (None caches results of any size)
+        """
+        self.maxsize = maxsize
+        self.max_cells = max_cells
+        # key -> (table names read by the query, result)
+        self._entries: OrderedDict[Hashable, tuple[frozenset[str], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Weak receivers, so the signals don't keep the cache alive; the uid is
+        # per cache, so each instance is connected exactly once
+        dispatch_uid = f"djazzle-result-cache-{id(self)}"
+        post_save.connect(self._on_model_change, weak=True, dispatch_uid=dispatch_uid)
+        post_delete.connect(self._on_model_change, weak=True, dispatch_uid=dispatch_uid)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached result for key, or MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            self._entries.move_to_end(key)
+        # Stored rows are never mutated, so copying can happen outside the lock
+        return _copy_rows(entry[1])
+
+    def set(self, key: Hashable, tables: frozenset[str], result: list) -> None:
+        """Cache a copy of result for key, unless it has more than max_cells values."""
+        if self.max_cells is not None and result:
+            if len(result) * _row_width(result[0]) > self.max_cells:
+                return
+
+        entry = (tables, _copy_rows(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table_name: str) -> None:
+        """Drop every cached result that reads from table_name."""
+        with self._lock:
+            stale = [key for key, (tables, _) in list(self._entries.items()) if table_name in tables]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def _on_model_change(self, sender, **kwargs) -> None:
+        if self._entries:
+            self.invalidate(sender._meta.db_table)
@@ -3,16 +3,74 @@ from uuid import UUID
 from django.db import models
 
 
+# Map Django field types to Python types
+_FIELD_TYPE_MAP: dict[type, tuple] = {
+    models.CharField: (str,),
+    models.TextField: (str,),
+    models.EmailField: (str,),
+    models.URLField: (str,),
+    models.SlugField: (str,),
+    models.IntegerField: (int,),
+    models.BigIntegerField: (int,),
+    models.SmallIntegerField: (int,),
+    models.PositiveIntegerField: (int,),
+    models.PositiveBigIntegerField: (int,),
+    models.PositiveSmallIntegerField: (int,),
+    models.FloatField: (float, int),
+    models.DecimalField: (float, int),
+    models.BooleanField: (bool,),
+    models.DateField: (str,),  # Can accept strings or date objects
+    models.DateTimeField: (str,),  # Can accept strings or datetime objects
+    models.TimeField: (str,),  # Can accept strings or time objects
+    models.DurationField: (str,),
+    models.BinaryField: (bytes,),
+    models.UUIDField: (str, UUID),
+    models.JSONField: (dict, list, str, int, float, bool),
+    models.ForeignKey: (int, str, UUID),
+    models.OneToOneField: (int, str, UUID),
+}
+
+
+def _valid_types_for_field(field) -> tuple:
+    """Valid Python types for a Django field, plus NoneType when it is nullable."""
+    if not field:
+        return (object,)
+
+    # The nearest class in the field's MRO that has an entry wins
+    valid = next(
+        (_FIELD_TYPE_MAP[cls] for cls in type(field).__mro__ if cls in _FIELD_TYPE_MAP),
+        (object,),
+    )
+
+    if getattr(field, "null", False):
+        valid += (type(None),)
+
+    return valid
+
+
+@lru_cache(maxsize=4096)
+def _quote_identifier(name: str) -> str:
+    """Double-quote an SQL identifier, doubling any embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 class Column:
     """Represents a table column for Djazzle queries."""
 
+    __slots__ = ("table_name", "column_name", "django_field", "_quoted", "order_sql", "_valid_types")
+
     def __init__(self, table_name: str, column_name: str, django_field=None):
         self.table_name = table_name
         self.column_name = column_name
         self.django_field = django_field
+        # Quoted identifier, built once; full_name() is called for every SQL build
+        self._quoted = _quote_identifier(column_name)
+        # ORDER BY fragment for a plain column (ascending), shared with OrderDirection
+        self.order_sql = f"{self._quoted} ASC"
+        self._valid_types: tuple | None = None
 
     def full_name(self) -> str:
-        return f'"{self.column_name}"'
+        return self._quoted
 
     def as_(self, alias_name: str) -> "Alias":
         """
@@ -25,89 +83,59 @@ class Column:
         return Alias(self, alias_name)
 
     @property
-    @lru_cache
     def valid_types(self) -> tuple:
         """
         Return a tuple of valid Python types for this column based on its Django field type.
         Always includes None if the field is nullable.
         """
-        field = getattr(self, "django_field", None)
-        if not field:
-            return (object,)
-
-        # Map Django field types to Python types
-        field_type_map = {
-            models.CharField: (str,),
-            models.TextField: (str,),
-            models.EmailField: (str,),
-            models.URLField: (str,),
-            models.SlugField: (str,),
-            models.IntegerField: (int,),
-            models.BigIntegerField: (int,),
-            models.SmallIntegerField: (int,),
-            models.PositiveIntegerField: (int,),
-            models.PositiveBigIntegerField: (int,),
-            models.PositiveSmallIntegerField: (int,),
-            models.FloatField: (float, int),
-            models.DecimalField: (float, int),
-            models.BooleanField: (bool,),
-            models.DateField: (str,),  # Can accept strings or date objects
-            models.DateTimeField: (str,),  # Can accept strings or datetime objects
-            models.TimeField: (str,),  # Can accept strings or time objects
-            models.DurationField: (str,),
-            models.BinaryField: (bytes,),
-            models.UUIDField: (str, UUID),
-            models.JSONField: (dict, list, str, int, float, bool),
-            models.ForeignKey: (int, str, UUID),
-            models.OneToOneField: (int, str, UUID),
-        }
-
-        # find the first matching type using isinstance
-        valid = next(
-            (
-                types
-                for field_type, types in field_type_map.items()
-                if isinstance(field, field_type)
-            ),
-            (object,),
-        )
-
-        if getattr(field, "null", False):
-            valid += (type(None),)
-
+        valid = self._valid_types
+        if valid is None:
+            valid = self._valid_types = _valid_types_for_field(self.django_field)
         return valid
 
 
+_ASC = "ASC"
+_DESC = "DESC"
+_DIRECTIONS = frozenset((_ASC, _DESC))
+
+
 class OrderDirection:
     """Represents a column with an order direction (ASC or DESC)."""
 
+    __slots__ = ("column", "direction", "order_sql")
+
     def __init__(self, column: Column, direction: str = "ASC"):
         self.column = column
-        self.direction = direction.upper()
+        # asc()/desc() already pass the canonical spelling
+        self.direction = direction if direction in _DIRECTIONS else direction.upper()
+        self.order_sql = f"{column.full_name()} {self.direction}"
 
     def to_sql(self) -> str:
-        return f"{self.column.full_name()} {self.direction}"
+        return self.order_sql
 
 
 class Alias:
     """Represents a column with an alias."""
 
+    __slots__ = ("column", "alias_name", "_sql")
+
     def __init__(self, column: Column, alias_name: str):
         self.column = column
         self.alias_name = alias_name
+        self._sql = f"{column.full_name()} AS {_quote_identifier(alias_name)}"
 
     def to_sql(self) -> str:
-        return f'{self.column.full_name()} AS "{self.alias_name}"'
+        return self._sql
 
 
 def asc(column: Column) -> OrderDirection:
     """Create an ascending order direction for a column."""
-    return OrderDirection(column, "ASC")
+    return OrderDirection(column, _ASC)
 
 
 def desc(column: Column) -> OrderDirection:
     """Create a descending order direction for a column."""
-    return OrderDirection(column, "DESC")
+    return OrderDirection(column, _DESC)
 
 
 def alias(column: Column, alias_name: str) -> Alias:
@@ -1,68 +1,104 @@
+from functools import lru_cache
 from .columns import Column
 from typing import Any
 
 
+@lru_cache(maxsize=128)
+def _placeholders(count: int) -> str:
+    """Comma-separated %s placeholders for an IN list of the given length."""
+    return ", ".join(["%s"] * count)
+
+
 class Condition:
-    """Represents a SQL WHERE condition."""
+    """
+    Represents a SQL WHERE condition.
 
-    def __init__(self, column: Column, operator: str, value):
-        self.column = column
-        self.operator = operator
-        self.value = value
+    Conditions are immutable: the clause and its parameters are built once in
+    __init__, so column, operator and value are read-only.
+    """
 
-    def to_sql(self):
-        # Check if value is a Column (for JOINs)
-        if isinstance(self.value, Column):
+    __slots__ = ("_column", "_operator", "_value", "_sql", "_params")
+
+    def __init__(self, column: Column, operator: str, value):
+        self._column = column
+        self._operator = operator
+        self._value = value
+        if isinstance(value, Column):
             # For JOINs, output the column reference directly
-            return (
-                f"{self.column.full_name()} {self.operator} {self.value.full_name()}",
-                None,
-            )
+            self._sql = f"{column.full_name()} {operator} {value.full_name()}"
+            self._params = ()
         else:
             # For regular conditions, use parameterized query
-            return f"{self.column.full_name()} {self.operator} %s", self.value
+            self._sql = f"{column.full_name()} {operator} %s"
+            self._params = (value,)
+
+    @property
+    def column(self) -> Column:
+        return self._column
+
+    @property
+    def operator(self) -> str:
+        return self._operator
+
+    @property
+    def value(self):
+        return self._value
+
+    def to_sql(self):
+        """
+        Returns the SQL clause and the sequence of parameters it binds, in order.
+
+        The parameters are always a sequence (possibly empty), so callers can
+        extend their parameter list without inspecting the value.
+        """
+        return self._sql, self._params
 
 
 class NullCondition(Condition):
     """Represents IS NULL or IS NOT NULL conditions."""
 
-    def __init__(self, column: Column, operator: str):
-        self.column = column
-        self.operator = operator
-        self.value = None
+    __slots__ = ()
 
-    def to_sql(self):
-        return f"{self.column.full_name()} {self.operator}", None
+    def __init__(self, column: Column, operator: str):
+        self._column = column
+        self._operator = operator
+        self._value = None
+        self._sql = f"{column.full_name()} {operator}"
+        self._params = ()
 
 
 class InCondition(Condition):
     """Represents IN or NOT IN conditions."""
 
-    def __init__(self, column: Column, values: list[Any], not_in: bool = False):
-        self.column = column
-        self.operator = "NOT IN" if not_in else "IN"
-        self.value = values
+    __slots__ = ()
 
-    def to_sql(self):
-        placeholders = ", ".join(["%s"] * len(self.value))
-        return f"{self.column.full_name()} {self.operator} ({placeholders})", self.value
+    def __init__(self, column: Column, values: list[Any], not_in: bool = False):
+        self._column = column
+        self._operator = "NOT IN" if not_in else "IN"
+        # Copied, so later changes to the caller's list can't desync the placeholders
+        self._value = tuple(values)
+        self._sql = f"{column.full_name()} {self._operator} ({_placeholders(len(self._value))})"
+        self._params = self._value
 
 
 class BetweenCondition(Condition):
     """Represents a BETWEEN condition."""
 
-    def __init__(self, column: Column, start: Any, end: Any):
-        self.column = column
-        self.operator = "BETWEEN"
-        self.value = (start, end)
+    __slots__ = ()
 
-    def to_sql(self):
-        return f"{self.column.full_name()} BETWEEN %s AND %s", self.value
+    def __init__(self, column: Column, start: Any, end: Any):
+        self._column = column
+        self._operator = "BETWEEN"
+        self._value = (start, end)
+        self._sql = f"{column.full_name()} BETWEEN %s AND %s"
+        self._params = self._value
 
 
 class CompoundCondition:
     """Represents a compound condition (AND/OR)."""
 
+    __slots__ = ("operator", "conditions", "column")
+
     def __init__(self, operator: str, *conditions: Condition):
         self.operator = operator
         self.conditions = conditions
@@ -72,22 +108,14 @@ class CompoundCondition:
         """
         Returns the SQL clause and a flat list of all parameters.
         """
-        clauses = []
-        params = []
-
-        for cond in self.conditions:
-            clause, value = cond.to_sql()
-            clauses.append(f"({clause})")
+        parts = [cond.to_sql() for cond in self.conditions]
+        combined_clause = f" {self.operator} ".join([f"({clause})" for clause, _ in parts])
 
-            # Handle different value types
-            if value is None:
-                pass
-            elif isinstance(value, (list, tuple)):
-                params.extend(value)
-            else:
-                params.append(value)
+        params = []
+        extend = params.extend
+        for _, values in parts:
+            extend(values)
 
-        combined_clause = f" {self.operator} ".join(clauses)
         return combined_clause, params
 
 
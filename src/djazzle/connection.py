@@ -1,5 +1,34 @@
 """Database connection adapter for supporting multiple connection types."""
 
+import sys
+from contextlib import asynccontextmanager, contextmanager
+
+# Detected connection type per connection class. Detection only looks at the
+# class (its driver base class and attributes), so it runs once per class.
+_CONN_TYPE_CACHE: dict[type, str] = {}
+
+# (module, class, connection type) per supported driver. Async classes come
+# first where a driver's async class could also match a sync check.
+_DRIVER_CLASSES = (
+    ('psycopg_pool', 'AsyncConnectionPool', 'psycopg3_async_pool'),
+    ('psycopg_pool', 'ConnectionPool', 'psycopg3_pool'),
+    ('psycopg2.extensions', 'connection', 'psycopg2'),
+    ('psycopg', 'AsyncConnection', 'psycopg3_async'),
+    ('psycopg', 'Connection', 'psycopg3'),
+    ('MySQLdb.connections', 'Connection', 'mysqlclient'),
+    ('pymysql.connections', 'Connection', 'pymysql'),
+    ('aiomysql.pool', 'Pool', 'aiomysql_pool'),
+    ('aiomysql.connection', 'Connection', 'aiomysql'),
+    ('asyncmy.pool', 'Pool', 'asyncmy_pool'),
+    ('asyncmy.connection', 'Connection', 'asyncmy'),
+)
+
+_ASYNC_CONN_TYPES = frozenset(
+    ('psycopg3_async', 'psycopg3_async_pool', 'aiomysql', 'aiomysql_pool', 'asyncmy', 'asyncmy_pool')
+)
+
+# Pools whose connections are checked out with acquire() and not committed on release
+_MYSQL_POOL_CONN_TYPES = frozenset(('aiomysql_pool', 'asyncmy_pool'))
 
 
 class ConnectionAdapter:
@@ -10,10 +39,12 @@ class ConnectionAdapter:
     - Django connections (default)
     - psycopg2 (PostgreSQL - sync only)
     - psycopg3 (PostgreSQL - sync and async)
+    - psycopg_pool ConnectionPool / AsyncConnectionPool (PostgreSQL)
     - mysqlclient (MySQL - sync only)
     - pymysql (MySQL - sync only)
     - aiomysql (MySQL - async only)
     - asyncmy (MySQL - async only)
+    - aiomysql / asyncmy Pool (MySQL - async only)
     """
 
     def __init__(self, conn):
@@ -22,50 +53,34 @@ class ConnectionAdapter:
         self.is_async = self._is_async_connection()
 
     def _detect_connection_type(self) -> str:
-        """Detect the type of connection."""
-        conn_module = type(self.conn).__module__
-        conn_class = type(self.conn).__name__
-
-        # Django connection
+        """Detect the type of connection (cached per connection class)."""
+        conn_cls = type(self.conn)
+        conn_type = _CONN_TYPE_CACHE.get(conn_cls)
+        if conn_type is None:
+            conn_type = _CONN_TYPE_CACHE[conn_cls] = self._detect_uncached_connection_type()
+        return conn_type
+
+    def _detect_uncached_connection_type(self) -> str:
+        """Detect the type of connection with isinstance checks against driver classes."""
+        # Django connections, including the django.db.connection proxy
         if hasattr(self.conn, 'vendor') and hasattr(self.conn, 'alias'):
             return 'django'
 
-        # psycopg2 (sync only) or psycopg3 (sync and async)
-        if 'psycopg' in conn_module:
-            # Distinguish between psycopg2 and psycopg3
-            if 'psycopg2' in conn_module:
-                return 'psycopg2'
-            elif 'psycopg' in conn_module:
-                # psycopg3 - check if it's an async connection
-                # AsyncConnection class is in psycopg for v3
-                if 'AsyncConnection' in conn_class or hasattr(self.conn, 'execute'):
-                    # Check if connection has async methods
-                    if hasattr(self.conn, '__aenter__'):
-                        return 'psycopg3_async'
-                return 'psycopg3'
-
-        # mysqlclient (MySQLdb)
-        if 'MySQLdb' in conn_module or '_mysql' in conn_module:
-            return 'mysqlclient'
-
-        # pymysql
-        if 'pymysql' in conn_module:
-            return 'pymysql'
-
-        # aiomysql
-        if 'aiomysql' in conn_module:
-            return 'aiomysql'
-
-        # asyncmy
-        if 'asyncmy' in conn_module:
-            return 'asyncmy'
+        for module_name, class_name, conn_type in _DRIVER_CLASSES:
+            # A driver that was never imported cannot have produced this connection
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            driver_class = getattr(module, class_name, None)
+            if driver_class is not None and isinstance(self.conn, driver_class):
+                return conn_type
 
         # Default to django if we can't detect
         return 'django'
 
     def _is_async_connection(self) -> bool:
         """Check if this is an async connection."""
-        return self.conn_type in ('psycopg3_async', 'aiomysql', 'asyncmy')
+        return self.conn_type in _ASYNC_CONN_TYPES
 
     def get_db_alias(self) -> str:
         """Get database alias (for Django model instantiation)."""
@@ -81,8 +96,37 @@ class ConnectionAdapter:
                 f"Cannot use sync cursor() with async connection type '{self.conn_type}'. "
                 f"Use async methods instead."
             )
+        if self.conn_type == 'psycopg3_pool':
+            return self._pooled_cursor()
         return self.conn.cursor()
 
+    @contextmanager
+    def _pooled_cursor(self):
+        """Check a connection out of the pool for the lifetime of one cursor."""
+        # The pool commits on a clean exit and returns the connection to the pool
+        with self.conn.connection() as conn, conn.cursor() as cur:
+            yield cur
+
+    @asynccontextmanager
+    async def _async_pooled_cursor(self):
+        """Async version of _pooled_cursor()."""
+        async with self.conn.connection() as conn, conn.cursor() as cur:
+            yield cur
+
+    @asynccontextmanager
+    async def _mysql_pooled_cursor(self):
+        """Acquire a connection from an aiomysql / asyncmy pool for one cursor."""
+        # Commit on success and roll back on error, like psycopg_pool, so no
+        # transaction is left open on a connection that goes back to the pool
+        async with self.conn.acquire() as conn:
+            try:
+                async with conn.cursor() as cur:
+                    yield cur
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+
     async def async_cursor(self):
         """Get a cursor from the connection (async)."""
         if not self.is_async:
@@ -90,5 +134,9 @@ class ConnectionAdapter:
                 f"Cannot use async_cursor() with sync connection type '{self.conn_type}'. "
                 f"Use sync methods instead."
             )
+        if self.conn_type == 'psycopg3_async_pool':
+            return self._async_pooled_cursor()
+        if self.conn_type in _MYSQL_POOL_CONN_TYPES:
+            return self._mysql_pooled_cursor()
         # aiomysql and asyncmy use async context managers for cursors
         return self.conn.cursor()
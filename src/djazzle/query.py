@@ -1,20 +1,126 @@
 from django.db import connection
+from functools import lru_cache
+from operator import itemgetter
 from typing import TypeVar, Dict, Any, Union
 from .table import TableFromModel
-from .conditions import Condition, CompoundCondition
+from .conditions import Condition, CompoundCondition, _placeholders
 from .exceptions import InvalidColumnError
 from django.db import models
-from .columns import Column, OrderDirection, Alias
+from django.db.models import DEFERRED
+from .columns import Column, OrderDirection, Alias, _quote_identifier
 from asgiref.sync import sync_to_async
 from .connection import ConnectionAdapter
+from .cache import MISSING, ResultCache
 
 
 T = TypeVar("T", bound=models.Model)
 
 
+@lru_cache(maxsize=256)
+def _row_to_dict(columns: tuple[str, ...]):
+    """
+    Compile a function that turns a result row into a dict keyed by columns.
+
+    Same result as dict(zip(columns, row)), including last-wins for duplicate
+    names, but a dict display with constant keys skips the zip iterator and is
+    about twice as fast on large results. Names are embedded with repr(), so any
+    column name is a safe literal (collections.namedtuple uses the same approach).
+    """
+    items = ", ".join(f"{name!r}: row[{index}]" for index, name in enumerate(columns))
+    return eval(f"lambda row: {{{items}}}")
+
+
+@lru_cache(maxsize=256)
+def _row_to_model(model_cls: type[models.Model], db_alias: str, columns: tuple[str, ...]):
+    """
+    Compile a function that turns a result row into a model instance via from_db().
+
+    Model.from_db() assumes values arrive in concrete field order and, for a
+    partial row, checks every field name against the selected names per row.
+    Here values are matched to fields by column name once per column set, so
+    the SELECT order doesn't matter and unselected fields are deferred.
+    """
+    fields = model_cls._meta.concrete_fields
+    attnames = tuple(field.attname for field in fields)
+    positions = {name: index for index, name in enumerate(columns)}
+    items = []
+    for field in fields:
+        # Result columns are named after the db column (or the attname if aliased)
+        index = positions.get(field.column, positions.get(field.attname))
+        items.append("DEFERRED" if index is None else f"row[{index}]")
+    namespace = {
+        "from_db": model_cls.from_db,
+        "db_alias": db_alias,
+        "attnames": attnames,
+        "DEFERRED": DEFERRED,
+    }
+    if len(columns) == len(fields) and items == [f"row[{index}]" for index in range(len(fields))]:
+        # Columns already in field order: pass the row through unchanged
+        values = "row"
+    else:
+        values = f"[{', '.join(items)}]"
+    return eval(f"lambda row: from_db(db_alias, attnames, {values})", namespace)
+
+
+@lru_cache(maxsize=512)
+def _select_list_sql(
+    table: TableFromModel, fields: tuple[str | Column | Alias, ...], validate: bool
+) -> str:
+    """
+    Validate and render the SELECT list for fields (strings, Columns or Aliases).
+
+    Cached per (table, fields), so a select list used by many queries is only
+    parsed once. Invalid fields raise every time, since exceptions aren't cached.
+    """
+    field_parts = []
+    for f in fields:
+        # Handle Alias objects
+        if isinstance(f, Alias):
+            field_parts.append(f.to_sql())
+        # Handle Column objects (already validated by the table)
+        elif isinstance(f, Column):
+            field_parts.append(f.full_name())
+        # Handle string field names
+        elif isinstance(f, str):
+            # Check if it contains an alias (column as alias)
+            if " as " in f.lower():
+                # Split on 'as' (case insensitive)
+                parts = f.split()
+                as_index = next(i for i, p in enumerate(parts) if p.lower() == "as")
+                col_part = " ".join(parts[:as_index])
+                alias_part = parts[as_index + 1]
+
+                # Handle qualified column name in the column part
+                if "." in col_part:
+                    table_name, col_name = col_part.rsplit(".", 1)
+                    field_parts.append(
+                        f"{_quote_identifier(table_name)}.{_quote_identifier(col_name)}"
+                        f" AS {_quote_identifier(alias_part)}"
+                    )
+                else:
+                    if validate and col_part not in table.column_names:
+                        raise InvalidColumnError(
+                            f"Column {col_part} not in model {table.db_table_name}"
+                        )
+                    field_parts.append(f"{_quote_identifier(col_part)} AS {_quote_identifier(alias_part)}")
+            # Check if it's a qualified column name (table.column), not validated
+            elif "." in f:
+                table_name, col_name = f.rsplit(".", 1)
+                field_parts.append(f"{_quote_identifier(table_name)}.{_quote_identifier(col_name)}")
+            else:
+                if validate and f not in table.column_names:
+                    raise InvalidColumnError(f"Column {f} not in model {table.db_table_name}")
+                field_parts.append(_quote_identifier(f))
+    return ", ".join(field_parts)
+
+
 class DjazzleQuery:
     """Main query builder for Djazzle."""
 
+    # Check referenced column names against the model when building SQL. Can be
+    # turned off per instance or for the whole class when queries are trusted.
+    validate_columns: bool = True
+
     def __init__(self, conn=None):
         """
         Initialize a DjazzleQuery instance.
@@ -25,10 +131,12 @@ class DjazzleQuery:
                 - Django connection object
                 - psycopg2 connection (PostgreSQL - sync only)
                 - psycopg3 connection (PostgreSQL - sync or async)
+                - psycopg_pool ConnectionPool or AsyncConnectionPool (PostgreSQL)
                 - mysqlclient connection (MySQLdb - sync only)
                 - pymysql connection (MySQL - sync only)
                 - aiomysql connection (MySQL - async only)
                 - asyncmy connection (MySQL - async only)
+                - aiomysql or asyncmy Pool (MySQL - async only)
         """
         # Use Django default connection if none provided
         raw_conn = conn or connection
@@ -38,10 +146,11 @@ class DjazzleQuery:
         self._fields: list[str | Column | Alias] | None = None
         self._conditions: list[Condition | CompoundCondition] = []
         self._as_model: bool = False
+        self._as_tuples: bool = False
         self._limit: int | None = None
         self._offset: int | None = None
         self._order_by: list[Column | OrderDirection] = []
-        self._distinct: bool = False
+        self._distinct_sql: str = ""  # "DISTINCT " after select_distinct()
         # Insert-specific state
         self._query_type: str = "select"  # "select", "insert", "update", or "delete"
         self._insert_values: list[Dict[str, Any]] | None = None
@@ -51,7 +160,11 @@ class DjazzleQuery:
         # Join state
         self._joins: list[tuple[str, TableFromModel, Condition]] = (
             []
-        )  # (join_type, table, condition)
+        )  # (rendered " <type> JOIN <table> ON " prefix, table, condition)
+        # (sql, params) from the last _build_sql(); cleared by every builder call
+        self._compiled: tuple[str, list[Any]] | None = None
+        # Opt-in SELECT result cache, kept across queries built on this instance
+        self._result_cache: ResultCache | None = None
 
     def _reset_query_state(self):
         """Reset query state when starting a new query."""
@@ -60,11 +173,12 @@ class DjazzleQuery:
         self._limit = None
         self._offset = None
         self._order_by = []
-        self._distinct = False
+        self._distinct_sql = ""
         self._insert_values = None
         self._update_values = None
         self._returning_fields = None
         self._joins = []
+        self._compiled = None
 
     def select(self, *fields: Union[str, Column, Alias]) -> "DjazzleQuery":
         self._reset_query_state()
@@ -74,10 +188,8 @@ class DjazzleQuery:
 
     def select_distinct(self, *fields: Union[str, Column, Alias]) -> "DjazzleQuery":
         """Select distinct values from the specified fields."""
-        self._reset_query_state()
-        self._query_type = "select"
-        self._fields = list(fields) if fields else None
-        self._distinct = True
+        self.select(*fields)
+        self._distinct_sql = "DISTINCT "
         return self
 
     def insert(self, table: TableFromModel) -> "DjazzleQuery":
@@ -113,6 +225,7 @@ class DjazzleQuery:
         # Validate types for each row
         self._validate_value_types(self._insert_values)
 
+        self._compiled = None
         return self
 
     def returning(self, *fields: str) -> "DjazzleQuery":
@@ -125,6 +238,7 @@ class DjazzleQuery:
             db.insert(users).values({"name": "Dan"}).returning("id", "name")
         """
         self._returning_fields = list(fields) if fields else ["*"]
+        self._compiled = None
         return self
 
     def update(self, table: TableFromModel) -> "DjazzleQuery":
@@ -156,6 +270,7 @@ class DjazzleQuery:
         # Validate types
         self._validate_value_types([data])
 
+        self._compiled = None
         return self
 
     def delete(self, table: TableFromModel) -> "DjazzleQuery":
@@ -176,10 +291,18 @@ class DjazzleQuery:
 
     def from_(self, table: TableFromModel) -> "DjazzleQuery":
         self._table = table
+        self._compiled = None
         return self
 
     def where(self, *conditions: Condition | CompoundCondition) -> "DjazzleQuery":
         self._conditions.extend(conditions)
+        self._compiled = None
+        return self
+
+    def _add_join(self, join_type: str, table: TableFromModel, condition: Condition) -> "DjazzleQuery":
+        # The "<type> JOIN <table> ON " prefix never changes, so render it once here
+        self._joins.append((f" {join_type} JOIN {table._quoted_name} ON ", table, condition))
+        self._compiled = None
         return self
 
     def left_join(self, table: TableFromModel, condition: Condition) -> "DjazzleQuery":
@@ -189,8 +312,7 @@ class DjazzleQuery:
         Example:
             db.select().from_(users).left_join(pets, eq(users.id, pets.owner_id))
         """
-        self._joins.append(("LEFT", table, condition))
-        return self
+        return self._add_join("LEFT", table, condition)
 
     def right_join(self, table: TableFromModel, condition: Condition) -> "DjazzleQuery":
         """
@@ -199,8 +321,7 @@ class DjazzleQuery:
         Example:
             db.select().from_(users).right_join(pets, eq(users.id, pets.owner_id))
         """
-        self._joins.append(("RIGHT", table, condition))
-        return self
+        return self._add_join("RIGHT", table, condition)
 
     def inner_join(self, table: TableFromModel, condition: Condition) -> "DjazzleQuery":
         """
@@ -209,8 +330,7 @@ class DjazzleQuery:
         Example:
             db.select().from_(users).inner_join(pets, eq(users.id, pets.owner_id))
         """
-        self._joins.append(("INNER", table, condition))
-        return self
+        return self._add_join("INNER", table, condition)
 
     def full_join(self, table: TableFromModel, condition: Condition) -> "DjazzleQuery":
         """
@@ -219,21 +339,63 @@ class DjazzleQuery:
         Example:
             db.select().from_(users).full_join(pets, eq(users.id, pets.owner_id))
         """
-        self._joins.append(("FULL", table, condition))
-        return self
+        return self._add_join("FULL", table, condition)
 
     def as_model(self, value: bool = True) -> "DjazzleQuery":
         self._as_model = value
         return self
 
+    def as_tuples(self, value: bool = True) -> "DjazzleQuery":
+        """
+        Return SELECT rows as the driver's tuples instead of dicts.
+
+        Skips building a dict per row, in column order of the SELECT.
+        Ignored when as_model() is also set.
+
+        Example:
+            db.select("id", "name").from_(users).as_tuples()()  # [(1, "John"), ...]
+        """
+        self._as_tuples = value
+        return self
+
+    def enable_result_cache(self, maxsize: int = 256, max_cells: int | None = 100_000) -> "DjazzleQuery":
+        """
+        Cache SELECT results of this instance, keyed by (SQL, params).
+
+        Repeated executions of the same SELECT return the cached result without
+        querying the database. Each call gets its own copy of the cached rows,
+        so changing one result doesn't affect later ones. Entries are invalidated when a model of a queried
+        table is saved or deleted through the ORM, and when this instance runs
+        an INSERT, UPDATE or DELETE; other writes require clear_result_cache().
+
+        Args:
+            maxsize: Maximum number of cached results (LRU eviction)
+            max_cells: Results with more values than this (rows x columns) are not cached
+                (None caches results of any size)
+
+        Example:
+            db = DjazzleQuery().enable_result_cache()
+            db.select().from_(users).where(eq(users.id, 1))()  # queries the database
+            db.select().from_(users).where(eq(users.id, 1))()  # served from the cache
+        """
+        self._result_cache = ResultCache(maxsize=maxsize, max_cells=max_cells)
+        return self
+
+    def clear_result_cache(self) -> None:
+        """Drop all results cached by enable_result_cache()."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
     def limit(self, count: int) -> "DjazzleQuery":
         """Set the LIMIT clause for the query."""
         self._limit = count
+        self._compiled = None
         return self
 
     def offset(self, count: int) -> "DjazzleQuery":
         """Set the OFFSET clause for the query."""
         self._offset = count
+        self._compiled = None
         return self
 
     def order_by(self, *columns: Column | OrderDirection) -> "DjazzleQuery":
@@ -249,6 +411,7 @@ class DjazzleQuery:
             query.order_by(users.name, desc(users.age))  # Multiple columns
         """
         self._order_by.extend(columns)
+        self._compiled = None
         return self
 
     def _validate_value_types(self, rows: list[Dict[str, Any]]) -> None:
@@ -264,19 +427,15 @@ class DjazzleQuery:
         if not self._table:
             return  # Can't validate without table
 
+        valid_types_by_column = self._table._column_valid_types()
         for row_idx, row in enumerate(rows):
             for col_name, value in row.items():
-                # Get the column object from the table
-                if not hasattr(self._table, col_name):
-                    # Column validation will catch this later
-                    continue
-
-                column = getattr(self._table, col_name)
-                if not isinstance(column, Column):
+                valid_types = valid_types_by_column.get(col_name)
+                if valid_types is None:
+                    # Column validation will catch unknown columns later
                     continue
 
                 # Check if the value type is valid
-                valid_types = column.valid_types
                 if not isinstance(value, valid_types):
                     # Build a helpful error message
                     type_names = ", ".join(t.__name__ for t in valid_types)
@@ -292,48 +451,16 @@ class DjazzleQuery:
             raise ValueError("No table selected")
         valid_columns = self._table.column_names
 
-        # Validate selected fields
-        if self._fields:
-            for f in self._fields:
-                # Skip validation for Column and Alias objects (they're already validated)
-                if isinstance(f, (Column, Alias)):
-                    continue
-                # Skip validation for qualified column names (table.column)
-                if "." in f:
-                    continue
-                # Skip validation for aliased columns (column as alias)
-                if " as " in f.lower():
-                    # Extract the column part before 'as'
-                    parts = f.split()
-                    as_index = next(i for i, p in enumerate(parts) if p.lower() == "as")
-                    col_name = " ".join(parts[:as_index])
-                    # Skip if it's a qualified name
-                    if "." in col_name:
-                        continue
-                    # Validate the actual column name
-                    if col_name not in self._table.column_names:
-                        raise InvalidColumnError(
-                            f"Column {col_name} not in model {self._table.db_table_name}"
-                        )
-                    continue
-                if f not in self._table.column_names:
-                    raise InvalidColumnError(
-                        f"Column {f} not in model {self._table.db_table_name}"
-                    )
-
         # Validate condition columns (including nested compound conditions)
-        def validate_condition(cond):
+        pending = list(self._conditions)
+        while pending:
+            cond = pending.pop()
             if isinstance(cond, CompoundCondition):
-                # Recursively validate nested conditions
-                for nested_cond in cond.conditions:
-                    validate_condition(nested_cond)
-            else:
-                col_name = getattr(cond.column, "column_name", None)
-                if col_name and col_name not in valid_columns:
-                    raise InvalidColumnError(f"Invalid column in condition: {col_name}")
-
-        for cond in self._conditions:
-            validate_condition(cond)
+                pending.extend(cond.conditions)
+                continue
+            col_name = getattr(cond.column, "column_name", None)
+            if col_name and col_name not in valid_columns:
+                raise InvalidColumnError(f"Invalid column in condition: {col_name}")
 
         # Validate order by columns
         for order_item in self._order_by:
@@ -351,114 +478,71 @@ class DjazzleQuery:
         Returns:
             tuple[str, list[Any]]: A tuple of (sql_string, parameters)
         """
+        if self._compiled is not None:
+            return self._compiled
+
         if not self._table:
             raise ValueError("No table selected")
 
-        if self._query_type == "insert":
-            return self._build_insert_sql()
-        elif self._query_type == "update":
-            return self._build_update_sql()
-        elif self._query_type == "delete":
-            return self._build_delete_sql()
-        else:
-            return self._build_select_sql()
+        compiled = self._BUILDERS[self._query_type](self)
+
+        # A prebuilt query is often executed many times; its SQL only changes
+        # when a builder method is called again
+        self._compiled = compiled
+        return compiled
+
+    def _append_where(self, parts: list[str], params: list[Any]) -> None:
+        """Append the WHERE clause (if any) to parts and its values to params."""
+        if not self._conditions:
+            return
+
+        clauses = []
+        for cond in self._conditions:
+            # Every condition returns its parameters as a (possibly empty) sequence
+            clause, values = cond.to_sql()
+            clauses.append(clause)
+            params.extend(values)
+        parts.append(" WHERE " + " AND ".join(clauses))
 
     def _build_select_sql(self) -> tuple[str, list[Any]]:
         """Build a SELECT query."""
-        self._validate_columns()
+        if self.validate_columns:
+            self._validate_columns()
 
-        # Handle field selection - support strings, Column objects, Alias objects
+        # Field selection depends only on the table and the fields, so it is
+        # validated and rendered once per distinct select list
         if self._fields:
-            field_parts = []
-            for f in self._fields:
-                # Handle Alias objects
-                if isinstance(f, Alias):
-                    field_parts.append(f.to_sql())
-                # Handle Column objects
-                elif isinstance(f, Column):
-                    field_parts.append(f.full_name())
-                # Handle string field names
-                elif isinstance(f, str):
-                    # Check if it contains an alias (column as alias)
-                    if " as " in f.lower():
-                        # Split on 'as' (case insensitive)
-                        parts = f.split()
-                        as_index = next(
-                            i for i, p in enumerate(parts) if p.lower() == "as"
-                        )
-                        col_part = " ".join(parts[:as_index])
-                        alias_part = parts[as_index + 1]
-
-                        # Handle qualified column name in the column part
-                        if "." in col_part:
-                            table_name, col_name = col_part.rsplit(".", 1)
-                            field_parts.append(
-                                f'"{table_name}"."{col_name}" AS "{alias_part}"'
-                            )
-                        else:
-                            field_parts.append(f'"{col_part}" AS "{alias_part}"')
-                    # Check if it's a qualified column name (table.column)
-                    elif "." in f:
-                        table_name, col_name = f.rsplit(".", 1)
-                        field_parts.append(f'"{table_name}"."{col_name}"')
-                    else:
-                        field_parts.append(f'"{f}"')
-            fields = ", ".join(field_parts)
+            fields = _select_list_sql(self._table, tuple(self._fields), self.validate_columns)
         else:
             fields = "*"
 
-        distinct_keyword = "DISTINCT " if self._distinct else ""
-        sql = f'SELECT {distinct_keyword}{fields} FROM "{self._table.db_table_name}"'
+        # Clauses are collected and joined once at the end
+        parts = [f'SELECT {self._distinct_sql}{fields} FROM {self._table._quoted_name}']
         params: list[Any] = []
 
         # Add JOIN clauses
-        for join_type, join_table, join_condition in self._joins:
-            join_clause, join_value = join_condition.to_sql()
-            sql += f' {join_type} JOIN "{join_table.db_table_name}" ON {join_clause}'
-            # Handle join condition parameters
-            if join_value is not None:
-                if isinstance(join_value, (list, tuple)):
-                    params.extend(join_value)
-                else:
-                    params.append(join_value)
-
-        if self._conditions:
-            clauses = []
-            for cond in self._conditions:
-                clause, value = cond.to_sql()
-                clauses.append(clause)
-                # Handle different value types (None, list/tuple, or single value)
-                if value is None:
-                    # IS NULL / IS NOT NULL conditions have no parameters
-                    pass
-                elif isinstance(value, (list, tuple)):
-                    # IN, NOT IN, BETWEEN conditions have multiple parameters
-                    params.extend(value)
-                else:
-                    # Regular conditions have a single parameter
-                    params.append(value)
-            sql += " WHERE " + " AND ".join(clauses)
+        for join_prefix, _, join_condition in self._joins:
+            join_clause, join_values = join_condition.to_sql()
+            parts.append(join_prefix)
+            parts.append(join_clause)
+            params.extend(join_values)
+
+        self._append_where(parts, params)
 
         # Add ORDER BY clause
+        # Plain Columns default to ASC; both kinds carry their prebuilt fragment
         if self._order_by:
-            order_clauses = []
-            for order_item in self._order_by:
-                if isinstance(order_item, OrderDirection):
-                    order_clauses.append(order_item.to_sql())
-                else:
-                    # If it's a plain Column, default to ASC
-                    order_clauses.append(f"{order_item.full_name()} ASC")
-            sql += " ORDER BY " + ", ".join(order_clauses)
+            parts.append(" ORDER BY " + ", ".join([item.order_sql for item in self._order_by]))
 
         # Add LIMIT clause
         if self._limit is not None:
-            sql += f" LIMIT {self._limit}"
+            parts.append(f" LIMIT {self._limit}")
 
         # Add OFFSET clause
         if self._offset is not None:
-            sql += f" OFFSET {self._offset}"
+            parts.append(f" OFFSET {self._offset}")
 
-        return sql, params
+        return "".join(parts), params
 
     def _build_insert_sql(self) -> tuple[str, list[Any]]:
         """Build an INSERT query."""
@@ -476,39 +560,47 @@ class DjazzleQuery:
                     seen.add(col)
 
         # Validate columns exist in table
-        valid_columns = self._table.column_names
-        for col in columns:
-            if col not in valid_columns:
-                raise InvalidColumnError(
-                    f"Column {col} not in model {self._table.db_table_name}"
-                )
+        if self.validate_columns:
+            valid_columns = self._table.column_names
+            for col in columns:
+                if col not in valid_columns:
+                    raise InvalidColumnError(
+                        f"Column {col} not in model {self._table.db_table_name}"
+                    )
 
         # Build INSERT statement
-        column_list = ", ".join(f'"{col}"' for col in columns)
-        sql = f'INSERT INTO "{self._table.db_table_name}" ({column_list})'
+        column_list = ", ".join(map(_quote_identifier, columns))
+        parts = [f'INSERT INTO {self._table._quoted_name} ({column_list})']
 
-        # Build VALUES clause
-        params: list[Any] = []
-        value_rows = []
-        for row in self._insert_values:
-            row_placeholders = []
-            for col in columns:
-                value = row.get(col, None)  # Use None for missing columns
-                row_placeholders.append("%s")
-                params.append(value)
-            value_rows.append(f"({', '.join(row_placeholders)})")
+        # Build VALUES clause: every row has the same placeholder group
+        rows = self._insert_values
+        row_sql = f"({_placeholders(len(columns))})"
+        parts.append(" VALUES " + ", ".join([row_sql] * len(rows)))
 
-        sql += " VALUES " + ", ".join(value_rows)
+        params: list[Any] = []
+        if len(columns) == 1:
+            # itemgetter() with one key returns the value itself, not a tuple
+            col = columns[0]
+            params = [row.get(col) for row in rows]
+        else:
+            getter = itemgetter(*columns)
+            extend = params.extend
+            for row in rows:
+                try:
+                    extend(getter(row))
+                except KeyError:
+                    # Use None for columns missing from this row
+                    extend([row.get(col) for col in columns])
 
         # Add RETURNING clause (PostgreSQL)
         if self._returning_fields is not None:
             if "*" in self._returning_fields:
-                sql += " RETURNING *"
+                parts.append(" RETURNING *")
             else:
-                returning_cols = ", ".join(f'"{f}"' for f in self._returning_fields)
-                sql += f" RETURNING {returning_cols}"
+                returning_cols = ", ".join(map(_quote_identifier, self._returning_fields))
+                parts.append(f" RETURNING {returning_cols}")
 
-        return sql, params
+        return "".join(parts), params
 
     def _build_update_sql(self) -> tuple[str, list[Any]]:
         """Build an UPDATE query."""
@@ -516,88 +608,73 @@ class DjazzleQuery:
             raise ValueError("No values specified for UPDATE. Use .set()")
 
         # Validate columns exist in table
-        valid_columns = self._table.column_names
-        for col in self._update_values.keys():
-            if col not in valid_columns:
-                raise InvalidColumnError(
-                    f"Column {col} not in model {self._table.db_table_name}"
-                )
+        if self.validate_columns:
+            valid_columns = self._table.column_names
+            for col in self._update_values.keys():
+                if col not in valid_columns:
+                    raise InvalidColumnError(
+                        f"Column {col} not in model {self._table.db_table_name}"
+                    )
 
         # Build UPDATE statement
-        sql = f'UPDATE "{self._table.db_table_name}"'
+        parts = [f'UPDATE {self._table._quoted_name}']
         params: list[Any] = []
 
         # Build SET clause
         set_clauses = []
         for col, value in self._update_values.items():
-            set_clauses.append(f'"{col}" = %s')
+            set_clauses.append(f"{_quote_identifier(col)} = %s")
             params.append(value)
 
-        sql += " SET " + ", ".join(set_clauses)
+        parts.append(" SET " + ", ".join(set_clauses))
 
         # Add WHERE clause
-        if self._conditions:
-            clauses = []
-            for cond in self._conditions:
-                clause, value = cond.to_sql()
-                clauses.append(clause)
-                # Handle different value types (None, list/tuple, or single value)
-                if value is None:
-                    pass
-                elif isinstance(value, (list, tuple)):
-                    params.extend(value)
-                else:
-                    params.append(value)
-            sql += " WHERE " + " AND ".join(clauses)
+        self._append_where(parts, params)
 
         # Add LIMIT clause
         if self._limit is not None:
-            sql += f" LIMIT {self._limit}"
+            parts.append(f" LIMIT {self._limit}")
 
         # Add RETURNING clause (PostgreSQL)
         if self._returning_fields is not None:
             if "*" in self._returning_fields:
-                sql += " RETURNING *"
+                parts.append(" RETURNING *")
             else:
-                returning_cols = ", ".join(f'"{f}"' for f in self._returning_fields)
-                sql += f" RETURNING {returning_cols}"
+                returning_cols = ", ".join(map(_quote_identifier, self._returning_fields))
+                parts.append(f" RETURNING {returning_cols}")
 
-        return sql, params
+        return "".join(parts), params
 
     def _build_delete_sql(self) -> tuple[str, list[Any]]:
         """Build a DELETE query."""
         # Build DELETE statement
-        sql = f'DELETE FROM "{self._table.db_table_name}"'
+        parts = [f'DELETE FROM {self._table._quoted_name}']
         params: list[Any] = []
 
         # Add WHERE clause
-        if self._conditions:
-            clauses = []
-            for cond in self._conditions:
-                clause, value = cond.to_sql()
-                clauses.append(clause)
-                # Handle different value types (None, list/tuple, or single value)
-                if value is None:
-                    pass
-                elif isinstance(value, (list, tuple)):
-                    params.extend(value)
-                else:
-                    params.append(value)
-            sql += " WHERE " + " AND ".join(clauses)
+        self._append_where(parts, params)
 
         # Add LIMIT clause
         if self._limit is not None:
-            sql += f" LIMIT {self._limit}"
+            parts.append(f" LIMIT {self._limit}")
 
         # Add RETURNING clause (PostgreSQL)
         if self._returning_fields is not None:
             if "*" in self._returning_fields:
-                sql += " RETURNING *"
+                parts.append(" RETURNING *")
             else:
-                returning_cols = ", ".join(f'"{f}"' for f in self._returning_fields)
-                sql += f" RETURNING {returning_cols}"
+                returning_cols = ", ".join(map(_quote_identifier, self._returning_fields))
+                parts.append(f" RETURNING {returning_cols}")
 
-        return sql, params
+        return "".join(parts), params
+
+    # SQL builder per query type, used by _build_sql()
+    _BUILDERS = {
+        "select": _build_select_sql,
+        "insert": _build_insert_sql,
+        "update": _build_update_sql,
+        "delete": _build_delete_sql,
+    }
 
     @property
     def sql(self) -> str:
@@ -627,7 +704,7 @@ class DjazzleQuery:
             print(query.params)  # [42]
         """
         _, params = self._build_sql()
-        return params
+        return list(params)
 
     def _execute(self):
         sql, params = self._build_sql()
@@ -643,52 +720,73 @@ class DjazzleQuery:
         with self.conn_adapter.cursor() as cur:
             cur.execute(sql, params)
 
-            if self._query_type == "insert":
-                # Handle INSERT queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
-                    return None
-            elif self._query_type == "update":
-                # Handle UPDATE queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
-                    return None
-            elif self._query_type == "delete":
-                # Handle DELETE queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
+            if self._query_type != "select":
+                # INSERT / UPDATE / DELETE: rows only come back with RETURNING
+                if self._returning_fields is None:
                     return None
+                columns = [desc[0] for desc in cur.description]
+                return list(map(_row_to_dict(tuple(columns)), cur.fetchall()))
             else:
                 # Handle SELECT queries
                 columns = [desc[0] for desc in cur.description]
 
                 if self._as_model:
-                    # Use from_db() for faster model instantiation - bypasses __init__
+                    # Build instances through from_db(), matching values to fields by name
                     model_cls: type[models.Model] = self._table.model_class
                     db_alias = self.conn_adapter.get_db_alias()
-                    return [
-                        model_cls.from_db(db_alias, columns, row)
-                        for row in cur.fetchall()
-                    ]
+                    return list(map(_row_to_model(model_cls, db_alias, tuple(columns)), cur.fetchall()))
+                elif self._as_tuples:
+                    return cur.fetchall()
                 else:
-                    results = [dict(zip(columns, row)) for row in cur.fetchall()]
+                    results = list(map(_row_to_dict(tuple(columns)), cur.fetchall()))
                     return results
 
+    def iterator(self, chunk_size: int = 2000):
+        """
+        Execute the query and yield result rows, fetching chunk_size rows at a time.
+
+        Rows are converted (to dicts, tuples or models, as with calling the query)
+        one batch at a time, so a large SELECT never holds every converted row in
+        memory at once. The cursor stays open until the generator is exhausted or
+        closed. Bypasses the result cache.
+
+        Example:
+            for row in db.select("id", "name").from_(users).iterator(chunk_size=500):
+                ...
+        """
+        sql, params = self._build_sql()
+
+        if self.conn_adapter.is_async:
+            raise RuntimeError(
+                f"Cannot use synchronous iterator() with async connection type '{self.conn_adapter.conn_type}'. "
+                f"Use await syntax instead: await query"
+            )
+
+        with self.conn_adapter.cursor() as cur:
+            cur.execute(sql, params)
+
+            # INSERT / UPDATE / DELETE only return rows with RETURNING
+            if self._query_type != "select" and self._returning_fields is None:
+                return
+
+            columns = [desc[0] for desc in cur.description]
+            if self._query_type != "select":
+                convert = _row_to_dict(tuple(columns))
+            elif self._as_model:
+                convert = _row_to_model(
+                    self._table.model_class, self.conn_adapter.get_db_alias(), tuple(columns)
+                )
+            elif self._as_tuples:
+                convert = None
+            else:
+                convert = _row_to_dict(tuple(columns))
+
+            while rows := cur.fetchmany(chunk_size):
+                if convert is None:
+                    yield from rows
+                else:
+                    yield from map(convert, rows)
+
     async def _aexecute(self):
         """
         Async version of query execution.
@@ -696,6 +794,8 @@ class DjazzleQuery:
         Supports:
         - Django async connections (using sync_to_async)
         - Native async connections (aiomysql, asyncmy)
+        - Other sync connections and pools (psycopg2, psycopg3, psycopg_pool,
+          PyMySQL), run on their own connection via sync_to_async
 
         Returns:
             Query results (same format as synchronous execution)
@@ -706,6 +806,11 @@ class DjazzleQuery:
             database connection inside the sync context to avoid thread-safety
             issues, as per Django 5.2+ guidelines.
         """
+        # A sync connection we were given (e.g. a psycopg_pool.ConnectionPool) must
+        # run the query itself, not Django's thread-local connection below
+        if not self.conn_adapter.is_async and self.conn_adapter.conn_type != 'django':
+            return await sync_to_async(self._execute)()
+
         sql, params = self._build_sql()
 
         # Handle native async connections (aiomysql, asyncmy)
@@ -716,6 +821,7 @@ class DjazzleQuery:
         query_type = self._query_type
         returning_fields = self._returning_fields
         as_model = self._as_model
+        as_tuples = self._as_tuples
         table = self._table
         conn_adapter = self.conn_adapter
 
@@ -731,50 +837,25 @@ class DjazzleQuery:
             with thread_local_conn.cursor() as cur:
                 cur.execute(sql, params)
 
-                if query_type == "insert":
-                    # Handle INSERT queries
-                    if returning_fields is not None:
-                        # RETURNING clause specified, fetch results
-                        columns = [desc[0] for desc in cur.description]
-                        results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                        return results
-                    else:
-                        # No RETURNING, return None
-                        return None
-                elif query_type == "update":
-                    # Handle UPDATE queries
-                    if returning_fields is not None:
-                        # RETURNING clause specified, fetch results
-                        columns = [desc[0] for desc in cur.description]
-                        results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                        return results
-                    else:
-                        # No RETURNING, return None
-                        return None
-                elif query_type == "delete":
-                    # Handle DELETE queries
-                    if returning_fields is not None:
-                        # RETURNING clause specified, fetch results
-                        columns = [desc[0] for desc in cur.description]
-                        results = [dict(zip(columns, row)) for row in cur.fetchall()]
-                        return results
-                    else:
-                        # No RETURNING, return None
+                if query_type != "select":
+                    # INSERT / UPDATE / DELETE: rows only come back with RETURNING
+                    if returning_fields is None:
                         return None
+                    columns = [desc[0] for desc in cur.description]
+                    return list(map(_row_to_dict(tuple(columns)), cur.fetchall()))
                 else:
                     # Handle SELECT queries
                     columns = [desc[0] for desc in cur.description]
 
                     if as_model:
-                        # Use from_db() for faster model instantiation - bypasses __init__
+                        # Build instances through from_db(), matching values to fields by name
                         model_cls: type[models.Model] = table.model_class
                         db_alias = conn_adapter.get_db_alias()
-                        return [
-                            model_cls.from_db(db_alias, columns, row)
-                            for row in cur.fetchall()
-                        ]
+                        return list(map(_row_to_model(model_cls, db_alias, tuple(columns)), cur.fetchall()))
+                    elif as_tuples:
+                        return cur.fetchall()
                     else:
-                        results = [dict(zip(columns, row)) for row in cur.fetchall()]
+                        results = list(map(_row_to_dict(tuple(columns)), cur.fetchall()))
                         return results
 
         return await execute_query()
@@ -794,60 +875,91 @@ class DjazzleQuery:
         async with await self.conn_adapter.async_cursor() as cur:
             await cur.execute(sql, params)
 
-            if self._query_type == "insert":
-                # Handle INSERT queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in await cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
-                    return None
-            elif self._query_type == "update":
-                # Handle UPDATE queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in await cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
-                    return None
-            elif self._query_type == "delete":
-                # Handle DELETE queries
-                if self._returning_fields is not None:
-                    # RETURNING clause specified, fetch results
-                    columns = [desc[0] for desc in cur.description]
-                    results = [dict(zip(columns, row)) for row in await cur.fetchall()]
-                    return results
-                else:
-                    # No RETURNING, return None
+            if self._query_type != "select":
+                # INSERT / UPDATE / DELETE: rows only come back with RETURNING
+                if self._returning_fields is None:
                     return None
+                columns = [desc[0] for desc in cur.description]
+                return list(map(_row_to_dict(tuple(columns)), await cur.fetchall()))
             else:
                 # Handle SELECT queries
                 columns = [desc[0] for desc in cur.description]
 
                 if self._as_model:
-                    # Use from_db() for faster model instantiation - bypasses __init__
+                    # Build instances through from_db(), matching values to fields by name
                     model_cls: type[models.Model] = self._table.model_class
                     db_alias = self.conn_adapter.get_db_alias()
-                    return [
-                        model_cls.from_db(db_alias, columns, row)
-                        for row in await cur.fetchall()
-                    ]
+                    return list(map(_row_to_model(model_cls, db_alias, tuple(columns)), await cur.fetchall()))
+                elif self._as_tuples:
+                    return await cur.fetchall()
                 else:
-                    results = [dict(zip(columns, row)) for row in await cur.fetchall()]
+                    results = list(map(_row_to_dict(tuple(columns)), await cur.fetchall()))
                     return results
 
+    def _result_cache_key(self):
+        """Cache key for the current SELECT, or None if it cannot be cached."""
+        sql, params = self._build_sql()
+        key = (sql, tuple(params), self._as_model, self._as_tuples)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _queried_tables(self) -> frozenset[str]:
+        return frozenset(
+            [self._table.db_table_name]
+            + [join_table.db_table_name for _, join_table, _ in self._joins]
+        )
+
+    def _execute_cached(self):
+        cache = self._result_cache
+        if self._query_type != "select":
+            result = self._execute()
+            cache.invalidate(self._table.db_table_name)
+            return result
+
+        key = self._result_cache_key()
+        if key is None:
+            return self._execute()
+        result = cache.get(key)
+        if result is MISSING:
+            result = self._execute()
+            cache.set(key, self._queried_tables(), result)
+        return result
+
+    async def _aexecute_cached(self):
+        cache = self._result_cache
+        if self._query_type != "select":
+            result = await self._aexecute()
+            cache.invalidate(self._table.db_table_name)
+            return result
+
+        key = self._result_cache_key()
+        if key is None:
+            return await self._aexecute()
+        result = cache.get(key)
+        if result is MISSING:
+            result = await self._aexecute()
+            cache.set(key, self._queried_tables(), result)
+        return result
+
     def __await__(self):
         """
         Allow using the query with await syntax.
 
         Example:
-            result = await db.select().from_(users)()
+            result = await db.select().from_(users)
+
+        Django connections run the query in a worker thread (sync_to_async);
+        async driver connections are awaited natively, so the event loop is
+        never blocked on the database.
         """
+        if self._result_cache is not None:
+            return self._aexecute_cached().__await__()
         return self._aexecute().__await__()
 
     def __call__(self):
+        if self._result_cache is not None and not self.conn_adapter.is_async:
+            return self._execute_cached()
         return self._execute()
@@ -1,6 +1,6 @@
 from typing import TypeVar, Generic, Type, TYPE_CHECKING, overload
 from django.db import models
-from .columns import Column
+from .columns import Column, _quote_identifier
 
 T = TypeVar("T", bound=models.Model)
 
@@ -12,13 +12,19 @@ class TableFromModel(Generic[T]):
     def __init__(self, model_class: Type[T]):
         self.model_class = model_class
         self.db_table_name = model_class._meta.db_table
-        self.column_names = set()
+        # Quoted identifier, built once for the SQL builders. Underscored so it
+        # can't collide with a model field set as an attribute below.
+        self._quoted_name = _quote_identifier(self.db_table_name)
+        column_names = set()
+        # Column objects by attribute name, for lookups without getattr()
+        self._columns: dict[str, Column] = {}
 
         for field in model_class._meta.get_fields():
             if hasattr(field, "column") and field.column:
                 col = Column(self.db_table_name, field.column, django_field=field)
                 setattr(self, field.name, col)
-                self.column_names.add(field.name)
+                self._columns[field.name] = col
+                column_names.add(field.name)
 
                 # For ForeignKey fields, also create a _id field
                 if isinstance(field, models.ForeignKey):
@@ -26,12 +32,27 @@ class TableFromModel(Generic[T]):
                     id_field_name = f"{field.name}_id"
                     id_col = Column(self.db_table_name, f"{field.column}_id", django_field=field)
                     setattr(self, id_field_name, id_col)
-                    self.column_names.add(id_field_name)
+                    self._columns[id_field_name] = id_col
+                    column_names.add(id_field_name)
+
+        # Checked by every query's column validation; fixed once the model is read
+        self.column_names = frozenset(column_names)
+        # Built on first use by _column_valid_types()
+        self._valid_types: dict[str, tuple] | None = None
 
         # TYPE_CHECKING-only RowType for editor hints
         if TYPE_CHECKING:
             self.RowType = typed_dict_from_model(model_class, list(self.column_names))
 
+    def _column_valid_types(self) -> dict[str, tuple]:
+        """Valid Python types per column name, used to type-check INSERT and UPDATE values."""
+        valid_types = self._valid_types
+        if valid_types is None:
+            valid_types = self._valid_types = {
+                name: column.valid_types for name, column in self._columns.items()
+            }
+        return valid_types
+
 
 # Factory function for proper typing
 if TYPE_CHECKING:
@@ -123,6 +123,16 @@ class TestInsert:
         assert "Test" in params
         assert 25 in params
 
+    def test_bulk_insert_sql_with_missing_columns(self, db, users_table):
+        """Test that rows missing a column get NULL in the column's position."""
+        query = db.insert(users_table).values([{"name": "A", "age": 1}, {"name": "B"}, {"age": 3}])
+        assert query.sql.endswith('("name", "age") VALUES (%s, %s), (%s, %s), (%s, %s)')
+        assert query.params == ["A", 1, "B", None, None, 3]
+
+        query = db.insert(users_table).values([{"name": "A"}, {"name": "B"}])
+        assert query.sql.endswith('("name") VALUES (%s), (%s)')
+        assert query.params == ["A", "B"]
+
     def test_invalid_type_raises(self, db, users_table):
         """Test that setting a column to an invalid type raises TypeError."""
         # Attempt to set age (IntegerField) to a string
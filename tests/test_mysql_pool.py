@@ -0,0 +1,66 @@
+"""Tests for aiomysql / asyncmy pool handling, using a fake pool (no MySQL server needed)."""
+
+import sys
+import types
+from contextlib import asynccontextmanager
+
+import pytest
+from src.djazzle.connection import ConnectionAdapter
+
+
+class FakeConnection:
+    def __init__(self):
+        self.events = []
+
+    @asynccontextmanager
+    async def cursor(self):
+        self.events.append("cursor")
+        yield object()
+
+    async def commit(self):
+        self.events.append("commit")
+
+    async def rollback(self):
+        self.events.append("rollback")
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        try:
+            yield self.conn
+        finally:
+            self.conn.events.append("release")
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """A pool detected as aiomysql's, by registering its class as aiomysql.pool.Pool."""
+    monkeypatch.setitem(sys.modules, "aiomysql.pool", types.SimpleNamespace(Pool=FakePool))
+    return FakePool()
+
+
+class TestMySQLPool:
+    def test_pool_detection(self, fake_pool):
+        adapter = ConnectionAdapter(fake_pool)
+        assert adapter.conn_type == "aiomysql_pool"
+        assert adapter.is_async
+
+    @pytest.mark.asyncio
+    async def test_commit_on_success(self, fake_pool):
+        adapter = ConnectionAdapter(fake_pool)
+        async with await adapter.async_cursor():
+            pass
+        assert fake_pool.conn.events == ["cursor", "commit", "release"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_error(self, fake_pool):
+        """A failed query must not leave its transaction open on the pooled connection."""
+        adapter = ConnectionAdapter(fake_pool)
+        with pytest.raises(ValueError):
+            async with await adapter.async_cursor():
+                raise ValueError("constraint violation")
+        assert fake_pool.conn.events == ["cursor", "rollback", "release"]
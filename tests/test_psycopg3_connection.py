@@ -378,3 +378,78 @@ class TestPsycopg3AsyncConnection:
         # Attempting to use sync call should raise an error
         with pytest.raises(RuntimeError, match="Cannot use synchronous execute"):
             db.select().from_(users_table)()
+
+
+class TestPsycopg3ConnectionPool:
+    """Test psycopg_pool connection pools with Djazzle."""
+
+    @pytest.fixture
+    def psycopg3_pool(self, psycopg3_sync_connection, psycopg3_connection_string):
+        """Create a psycopg_pool ConnectionPool (the sync connection creates the table)."""
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            pytest.skip("psycopg-pool not installed. Install with: pip install psycopg-pool")
+
+        pool = ConnectionPool(psycopg3_connection_string, min_size=1, max_size=2, open=True)
+        yield pool
+        pool.close()
+
+    @pytest_asyncio.fixture
+    async def psycopg3_async_pool(self, psycopg3_sync_connection, psycopg3_connection_string):
+        """Create a psycopg_pool AsyncConnectionPool."""
+        try:
+            from psycopg_pool import AsyncConnectionPool
+        except ImportError:
+            pytest.skip("psycopg-pool not installed. Install with: pip install psycopg-pool")
+
+        pool = AsyncConnectionPool(psycopg3_connection_string, min_size=1, max_size=2, open=False)
+        await pool.open()
+        yield pool
+        await pool.close()
+
+    def test_pool_detection(self, psycopg3_pool):
+        """Test that a sync pool is detected correctly."""
+        from src.djazzle.connection import ConnectionAdapter
+
+        adapter = ConnectionAdapter(psycopg3_pool)
+        assert adapter.conn_type == 'psycopg3_pool'
+        assert adapter.is_async is False
+
+    def test_pool_insert_and_select(self, psycopg3_pool, users_table):
+        """Test that writes through the pool are committed and visible to later checkouts."""
+        db = DjazzleQuery(conn=psycopg3_pool)
+
+        db.insert(users_table).values({
+            "name": "PoolAlice",
+            "age": 30,
+            "email": "pool.alice@example.com",
+            "username": "pool_alice",
+            "address": "1 Pool St"
+        })()
+
+        results = db.select("name", "age").from_(users_table).where(eq(users_table.name, "PoolAlice"))()
+
+        assert len(results) == 1
+        assert results[0]["age"] == 30
+
+    @pytest.mark.asyncio
+    async def test_async_pool_select(self, psycopg3_async_pool, users_table):
+        """Test async INSERT and SELECT through an async pool."""
+        from src.djazzle.connection import ConnectionAdapter
+
+        assert ConnectionAdapter(psycopg3_async_pool).conn_type == 'psycopg3_async_pool'
+
+        db = DjazzleQuery(conn=psycopg3_async_pool)
+        await db.insert(users_table).values({
+            "name": "AsyncPoolBob",
+            "age": 40,
+            "email": "async.pool.bob@example.com",
+            "username": "async_pool_bob",
+            "address": "2 Pool St"
+        })
+
+        results = await db.select("name", "age").from_(users_table).where(eq(users_table.name, "AsyncPoolBob"))
+
+        assert len(results) == 1
+        assert results[0]["age"] == 40
@@ -0,0 +1,58 @@
+"""Tests for psycopg_pool.ConnectionPool handling, using a fake pool over sqlite3 (no PostgreSQL needed)."""
+
+import sqlite3
+import sys
+import types
+from contextlib import closing, contextmanager
+
+import pytest
+from src.djazzle import DjazzleQuery
+from src.djazzle.connection import ConnectionAdapter
+
+
+class FakeConnection:
+    def __init__(self):
+        # Queries run on another thread when awaited (sync_to_async)
+        self.sqlite = sqlite3.connect(":memory:", check_same_thread=False)
+        self.sqlite.execute('CREATE TABLE "tests_user" ("id" INTEGER PRIMARY KEY, "name" TEXT)')
+        self.sqlite.execute("""INSERT INTO "tests_user" VALUES (1, 'PooledUser')""")
+
+    def cursor(self):
+        return closing(self.sqlite.cursor())
+
+
+class FakeConnectionPool:
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.checkouts = 0
+
+    @contextmanager
+    def connection(self):
+        self.checkouts += 1
+        yield self.conn
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """A pool detected as psycopg_pool's, by registering its class as psycopg_pool.ConnectionPool."""
+    monkeypatch.setitem(sys.modules, "psycopg_pool", types.SimpleNamespace(ConnectionPool=FakeConnectionPool))
+    return FakeConnectionPool()
+
+
+class TestPsycopgPool:
+    def test_pool_detection(self, fake_pool):
+        adapter = ConnectionAdapter(fake_pool)
+        assert adapter.conn_type == "psycopg3_pool"
+        assert not adapter.is_async
+
+    def test_sync_query_uses_pool(self, fake_pool, users_table):
+        rows = DjazzleQuery(conn=fake_pool).select("id", "name").from_(users_table)()
+        assert rows == [{"id": 1, "name": "PooledUser"}]
+        assert fake_pool.checkouts == 1
+
+    @pytest.mark.asyncio
+    async def test_awaited_query_uses_pool(self, fake_pool, users_table):
+        """Awaiting a query on a sync pool must not fall back to Django's connection."""
+        rows = await DjazzleQuery(conn=fake_pool).select("id", "name").from_(users_table)
+        assert rows == [{"id": 1, "name": "PooledUser"}]
+        assert fake_pool.checkouts == 1
@@ -1,7 +1,8 @@
 """Tests for SELECT queries."""
 
 import pytest
-from src.djazzle import eq
+from src.djazzle import eq, gt, and_, or_, is_null, between, in_array, not_in_array, asc, desc
+from src.djazzle import InvalidColumnError
 from tests.models import User, Pet
 
 
@@ -30,6 +31,110 @@ class TestBasicSelect:
         assert user.name == "Bob"
         assert user.age is None
 
+    def test_model_return_column_order(self, db, users_table, sample_users):
+        """Test model instances get values by column name, whatever the SELECT order."""
+        user = db.select("address", "name", "id").from_(users_table).where(eq(users_table.name, "Bob")).as_model()()[0]
+        assert (user.id, user.name, user.address) == (User.objects.get(name="Bob").id, "Bob", "456 Bob St")
+        assert user.get_deferred_fields() == {"age", "email", "username"}
+
+    def test_in_array(self, db, users_table, sample_users):
+        """Test IN and NOT IN conditions with a list of values."""
+        query = db.select("name").from_(users_table).where(in_array(users_table.name, ["Alice", "Bob", "Nobody"]))
+        assert query.sql.endswith('WHERE "name" IN (%s, %s, %s)')
+        assert sorted(row["name"] for row in query()) == ["Alice", "Bob"]
+
+        rows = db.select("name").from_(users_table).where(not_in_array(users_table.name, ["Alice"]))()
+        assert [row["name"] for row in rows] == ["Bob"]
+
+    def test_compound_conditions(self, db, users_table, sample_users):
+        """Test nested and_/or_ conditions flatten their parameters in order."""
+        query = db.select("name").from_(users_table).where(
+            or_(
+                and_(eq(users_table.name, "Alice"), gt(users_table.age, 18)),
+                is_null(users_table.age),
+                in_array(users_table.name, ["Carol", "Dave"]),
+                between(users_table.age, 40, 50),
+            )
+        )
+        assert query.sql.endswith(
+            'WHERE (("name" = %s) AND ("age" > %s)) OR ("age" IS NULL) '
+            'OR ("name" IN (%s, %s)) OR ("age" BETWEEN %s AND %s)'
+        )
+        assert query.params == ["Alice", 18, "Carol", "Dave", 40, 50]
+        assert sorted(row["name"] for row in query()) == ["Alice", "Bob"]
+
+    def test_condition_params_are_sequences(self, db, users_table, sample_users):
+        """Test that every condition binds its parameters as a sequence, whatever the value type."""
+        assert eq(users_table.age, 30).to_sql()[1] == (30,)
+        assert is_null(users_table.age).to_sql()[1] == ()
+        assert eq(users_table.id, users_table.age).to_sql()[1] == ()
+
+        # Any iterable works for IN lists, not only lists and tuples
+        query = db.select("name").from_(users_table).where(in_array(users_table.age, range(29, 32)))
+        assert query.params == [29, 30, 31]
+        assert query() == [{"name": "Alice"}]
+
+    def test_conditions_are_immutable(self, users_table):
+        """Test that a condition's SQL can't drift from its attributes after construction."""
+        cond = eq(users_table.age, 30)
+        with pytest.raises(AttributeError):
+            cond.value = 31
+        assert cond.to_sql() == ('"age" = %s', (30,))
+
+        ages = [29, 30]
+        cond = in_array(users_table.age, ages)
+        ages.append(31)
+        assert cond.to_sql() == ('"age" IN (%s, %s)', (29, 30))
+
+    def test_unusual_column_names(self, db, users_table, sample_users):
+        """Test that result keys keep quotes, braces and backslashes in column aliases."""
+        name = "it's {a} \\ \"b\""
+        rows = db.select(users_table.name.as_(name)).from_(users_table).where(eq(users_table.name, "Alice"))()
+        assert rows == [{name: "Alice"}]
+
+    def test_select_distinct(self, db, users_table, sample_users):
+        """Test SELECT DISTINCT, and that a following select() drops DISTINCT again."""
+        query = db.select_distinct("address").from_(users_table)
+        assert query.sql.startswith('SELECT DISTINCT "address" FROM')
+        assert len(query()) == 2
+
+        assert db.select("address").from_(users_table).sql.startswith('SELECT "address" FROM')
+
+    def test_order_by(self, db, users_table, sample_users):
+        """Test ORDER BY with plain columns (ASC) and asc()/desc() directions."""
+        query = db.select("name").from_(users_table).order_by(desc(users_table.name), users_table.id)
+        assert query.sql.endswith('ORDER BY "name" DESC, "id" ASC')
+        assert [row["name"] for row in query()] == ["Bob", "Alice"]
+
+        query = db.select("name").from_(users_table).order_by(asc(users_table.name))
+        assert query.sql.endswith('ORDER BY "name" ASC')
+
+    def test_invalid_columns(self, db, users_table, pets_table):
+        """Test that unknown columns raise, including inside nested conditions, unless disabled."""
+        with pytest.raises(InvalidColumnError):
+            db.select("nope").from_(users_table).sql
+        with pytest.raises(InvalidColumnError):
+            db.select().from_(users_table).where(or_(eq(users_table.name, "A"), and_(eq(pets_table.species, "cat")))).sql
+
+        db.validate_columns = False
+        assert db.select("nope").from_(users_table).sql.startswith('SELECT "nope"')
+        # The cached select list built without validation is not reused when validating
+        db.validate_columns = True
+        with pytest.raises(InvalidColumnError):
+            db.select("nope").from_(users_table).sql
+
+    def test_tuple_return(self, db, users_table, sample_users):
+        """Test SELECT query returning raw row tuples."""
+        rows = db.select("name", "age").from_(users_table).where(eq(users_table.name, "Alice")).as_tuples()()
+        assert len(rows) == 1
+        assert tuple(rows[0]) == ("Alice", 30)
+
+    def test_iterator(self, db, users_table, sample_users):
+        """Test streaming rows in small batches matches executing the query."""
+        query = db.select("id", "name").from_(users_table).order_by(users_table.id)
+        assert list(query.iterator(chunk_size=1)) == query()
+        assert [user.name for user in query.as_model().iterator(chunk_size=1)] == ["Alice", "Bob"]
+
 
 @pytest.mark.django_db
 class TestSelectAliases:
@@ -192,3 +297,144 @@ class TestJoins:
         assert '"name"' in sql
         assert '"name" AS "pet_name"' in sql
         assert "LEFT JOIN" in sql
+
+
+@pytest.mark.django_db
+class TestQueryReuse:
+    """Tests for executing the same query object more than once."""
+
+    def test_repeated_execution(self, db, users_table, sample_users):
+        """Test that a prebuilt query can be executed repeatedly."""
+        query = db.select("name").from_(users_table).where(eq(users_table.name, "Alice"))
+        assert query() == query() == [{"name": "Alice"}]
+
+    def test_builder_call_after_execution(self, db, users_table, sample_users):
+        """Test that builder calls after execution change the generated SQL."""
+        query = db.select("name").from_(users_table)
+        assert len(query()) == User.objects.count()
+
+        query.where(eq(users_table.name, "Alice")).limit(1)
+        assert query.sql.endswith('WHERE "name" = %s LIMIT 1')
+        assert query.params == ["Alice"]
+        assert query() == [{"name": "Alice"}]
+
+
+@pytest.mark.django_db
+class TestResultCache:
+    """Tests for the opt-in SELECT result cache."""
+
+    def test_repeated_select_is_cached(self, db, users_table, sample_users, django_assert_num_queries):
+        """Test that an identical SELECT is served from the cache."""
+        db.enable_result_cache()
+        query = db.select("name").from_(users_table).where(eq(users_table.name, "Alice"))
+        with django_assert_num_queries(1):
+            assert query() == [{"name": "Alice"}]
+            assert query() == [{"name": "Alice"}]
+        with django_assert_num_queries(1):
+            assert db.select("name").from_(users_table).where(eq(users_table.name, "Bob"))() == [{"name": "Bob"}]
+
+    def test_result_shape_is_part_of_key(self, db, users_table, sample_users):
+        """Test that dict, tuple and model results are cached separately."""
+        db.enable_result_cache()
+        query = db.select("name").from_(users_table).where(eq(users_table.name, "Alice"))
+        assert query() == [{"name": "Alice"}]
+        assert query.as_tuples()() == [("Alice",)]
+
+    def test_cached_results_are_copies(self, db, users_table, sample_users):
+        """Test that changing a returned result doesn't change what later calls get."""
+        db.enable_result_cache()
+        query = db.select("name").from_(users_table).where(eq(users_table.name, "Alice"))
+        first = query()
+        first[0]["name"] = "changed"
+        first.append({"name": "extra"})
+        assert query() == [{"name": "Alice"}]
+
+        hit = query()
+        hit[0]["name"] = "changed"
+        assert query() == [{"name": "Alice"}]
+
+        user = query.as_model()()[0]
+        user.name = "changed"
+        assert query()[0].name == "Alice"
+
+    def test_invalidated_by_orm_save(self, db, users_table, sample_users):
+        """Test that saving a model through the ORM invalidates its table."""
+        db.enable_result_cache()
+        query = db.select("age").from_(users_table).where(eq(users_table.name, "Alice"))
+        assert query() == [{"age": 30}]
+
+        User.objects.filter(name="Alice").update(age=31)
+        assert query() == [{"age": 30}]  # QuerySet.update() sends no signals
+
+        alice = User.objects.get(name="Alice")
+        alice.save()
+        assert query() == [{"age": 31}]
+
+    def test_invalidated_by_own_writes(self, db, users_table, sample_users):
+        """Test that INSERT/UPDATE/DELETE on the same instance invalidate the table."""
+        db.enable_result_cache()
+        select_count = lambda: len(db.select("id").from_(users_table)())  # noqa: E731
+        assert select_count() == 2
+
+        db.insert(users_table).values(
+            {"name": "Carol", "email": "carol@example.com", "username": "carol", "address": "789 Carol St"}
+        )()
+        assert select_count() == 3
+
+        db.delete(users_table).where(eq(users_table.name, "Carol"))()
+        assert select_count() == 2
+
+    def test_limits(self, db, users_table, sample_users):
+        """Test the maxsize and max_cells limits."""
+        db.enable_result_cache(maxsize=1, max_cells=None)
+        db.select("name").from_(users_table)()
+        db.select("age").from_(users_table)()
+        assert len(db._result_cache) == 1
+
+        db.enable_result_cache(max_cells=3)
+        db.select("name", "age").from_(users_table)()  # 2 rows x 2 columns
+        assert len(db._result_cache) == 0
+        db.select("name").from_(users_table)()
+        assert len(db._result_cache) == 1
+
+        db.enable_result_cache()
+        db.select("name").from_(users_table)()
+        db.clear_result_cache()
+        assert len(db._result_cache) == 0
+
+    def test_concurrent_invalidation(self):
+        """Test that invalidation from a saving thread is safe while another thread fills the cache."""
+        import sys
+        import threading
+        from src.djazzle.cache import ResultCache
+
+        # Switch threads as often as possible to expose unsynchronized access
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        # The cache stays full, so invalidate() walks it while set() evicts
+        cache = ResultCache(maxsize=256)
+        errors = []
+        done = threading.Event()
+
+        def fill():
+            try:
+                for i in range(20_000):
+                    cache.set(("q", i), frozenset({"tests_pet"}), [{"i": i}])
+                    cache.get(("q", i - 1))
+            except Exception as exc:  # pragma: no cover - only on failure
+                errors.append(exc)
+            finally:
+                done.set()
+
+        filler = threading.Thread(target=fill)
+        filler.start()
+        try:
+            while not done.is_set():
+                cache.invalidate("tests_user")
+        except Exception as exc:  # pragma: no cover - only on failure
+            errors.append(exc)
+        finally:
+            filler.join()
+            sys.setswitchinterval(previous_interval)
+        assert errors == []